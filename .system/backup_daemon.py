@@ -12,7 +12,6 @@ import subprocess
 import time
 import datetime
 import os
-import hashlib
 import sys
 import gzip
 import shutil
@@ -48,13 +47,18 @@ LOGS_ARCHIVE = GDRIVE_BASE / "logs" / "archive"
 VERSIONS_DIR = GDRIVE_BASE / "versions"
 
 LOG_FILE = LOGS_LIVE / "backup.log"
+LAST_SYNC_FILE = CLONE_D.parent / "last_sync.ts"  # Survives daemon restarts
+
+EXCLUDE_DIRS = {'chrome_profile', '__pycache__', '.git', 'node_modules', 'venv', '.venv'}
+EXCLUDE_EXTS = ('.tmp', '.pyc')
 
 # === TIMING ===
 CLONE_INTERVAL = 60       # D: clone every 1 minute
 LOG_ROTATE_DAYS = 7       # Compress logs older than 7 days
 VERSION_INTERVAL = 3600   # Create version snapshot every 1 hour
 
-last_clone_hash = None
+last_clone_time = 0
+last_archive_time = 0
 last_version_time = 0
 
 def setup_folders():
@@ -69,27 +73,52 @@ def log(msg):
     with open(LOG_FILE, 'a', encoding='utf-8') as f:
         f.write(entry + '\n')
 
-def get_hash():
-    hasher = hashlib.md5()
-    count = 0
-    for root, dirs, files in os.walk(SOURCE):
-        dirs[:] = [d for d in dirs if d not in {'chrome_profile', '__pycache__', '.git', 'node_modules', '.venv'}]
-        for fname in sorted(files):
-            if not fname.endswith(('.tmp', '.pyc')):
-                fpath = Path(root) / fname
-                try:
-                    stat = fpath.stat()
-                    count += 1
-                    hasher.update(f"{fpath}:{stat.st_mtime}:{stat.st_size}".encode())
-                except:
-                    pass
-    return hasher.hexdigest(), count
+def changed_since(root, since):
+    """True as soon as anything under root was modified after `since`.
+
+    Folder mtimes change on create/delete/rename, so removals are caught too.
+    On Windows DirEntry.stat() comes from the directory listing, so an
+    unchanged tree costs one scandir per folder and no per-file syscalls.
+    """
+    try:
+        if os.stat(root).st_mtime > since:
+            return True
+    except OSError:
+        return False
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in EXCLUDE_DIRS:
+                            continue
+                        stack.append(entry.path)
+                    elif entry.name.endswith(EXCLUDE_EXTS):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime > since:
+                        return True
+        except OSError:
+            continue
+    return False
+
+def load_last_sync():
+    try:
+        return float(LAST_SYNC_FILE.read_text())
+    except (OSError, ValueError):
+        return 0
+
+def save_last_sync(ts):
+    try:
+        LAST_SYNC_FILE.write_text(str(ts))
+    except OSError:
+        pass
 
 def sync_clone():
     """Real-time sync to D: drive"""
     cmd = ['robocopy', str(SOURCE), str(CLONE_D), '/MIR',
            '/XD', 'chrome_profile', '__pycache__', '.git', 'node_modules', 'venv', '.venv',
-           '/XF', '*.tmp', '*.pyc', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1']
+           '/XF', '*.tmp', '*.pyc', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1', '/MT:8']
     return subprocess.run(cmd, capture_output=True).returncode <= 7
 
 def sync_archive():
@@ -97,13 +126,13 @@ def sync_archive():
     # 1. Sync Code
     cmd_code = ['robocopy', str(SOURCE), str(ARCHIVE_CODE), '/MIR',
            '/XD', 'chrome_profile', '__pycache__', '.git', 'node_modules', 'venv', '.venv',
-           '/XF', '*.tmp', '*.pyc', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1']
+           '/XF', '*.tmp', '*.pyc', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1', '/MT:8']
     res_code = subprocess.run(cmd_code, capture_output=True).returncode <= 7
 
     # 2. Sync Inbox (Antigravity Push)
     if INBOX_SOURCE.exists():
         cmd_inbox = ['robocopy', str(INBOX_SOURCE), str(INBOX_ARCHIVE), '/MIR',
-                     '/XF', '*.tmp', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1']
+                     '/XF', '*.tmp', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1', '/MT:8']
         res_inbox = subprocess.run(cmd_inbox, capture_output=True).returncode <= 7
     else:
         res_inbox = True # Skip if source doesn't exist
@@ -121,7 +150,7 @@ def create_version_snapshot():
     log(f"VERSION SNAPSHOT → {timestamp}")
     cmd = ['robocopy', str(SOURCE), str(version_dir), '/MIR',
            '/XD', 'chrome_profile', '__pycache__', '.git', 'node_modules', 'venv', '.venv',
-           '/XF', '*.tmp', '*.pyc', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1']
+           '/XF', '*.tmp', '*.pyc', '/NP', '/NFL', '/NDL', '/NJH', '/NJS', '/R:1', '/W:1', '/MT:8']
     subprocess.run(cmd, capture_output=True)
 
 def rotate_logs():
@@ -145,7 +174,7 @@ def rotate_logs():
             log(f"ROTATED: {log_file.name} → {gz_path.name}")
 
 def run():
-    global last_clone_hash, last_version_time
+    global last_clone_time, last_archive_time, last_version_time
     
     setup_folders()
     
@@ -158,31 +187,39 @@ def run():
     log(f"Versions: {VERSIONS_DIR}")
     log("=" * 60)
     
-    current_hash, count = get_hash()
-    last_clone_hash = current_hash
     last_version_time = time.time()
     
-    log(f"Initial: {count} files")
-    sync_clone()
+    # Initial sync always runs: robocopy /MIR reconciles the clone even if D:
+    # was edited, emptied or replaced while the daemon was down, which source
+    # mtimes can't show. The mtime gate only applies inside the loop.
+    last_clone_time = load_last_sync()
+    started = time.time()
+    if sync_clone():
+        last_clone_time = started
+        save_last_sync(started)
     sync_archive()
+    last_archive_time = started
     create_version_snapshot()
     
     while True:
         time.sleep(CLONE_INTERVAL)
         
-        current_hash, count = get_hash()
+        # Stamp before scanning so edits made during a sync are caught next time
         now = time.time()
         
-        # D: CLONE - Real-time
-        if current_hash != last_clone_hash:
+        # D: CLONE - Real-time, only when something changed
+        if changed_since(SOURCE, last_clone_time):
             if sync_clone():
-                log(f"CLONE → D: ({count} files)")
-                last_clone_hash = current_hash
+                log("CLONE → D:")
+                last_clone_time = now
+                save_last_sync(now)
         
         # VERSION SNAPSHOT - Hourly
         if now - last_version_time >= VERSION_INTERVAL:
             create_version_snapshot()
-            sync_archive()
+            if changed_since(SOURCE, last_archive_time) or changed_since(INBOX_SOURCE, last_archive_time):
+                sync_archive()
+                last_archive_time = now
             rotate_logs()
             last_version_time = now
 
@@ -9,6 +9,26 @@ from typing import Optional, Dict, Any, List
 logger = logging.getLogger("BrowserController")
 logger.setLevel(logging.INFO)
 
+# Page-side lookup cache, installed on demand by call_function. Scripts call
+# window.__hndl.find(name, selector, predicate) and get the element back from a
+# WeakRef cache while it is still attached, instead of re-scanning the DOM.
+_DOM_CACHE_JS = """
+window.__hndl = window.__hndl || {
+    cache: new Map(),
+    find(name, selector, predicate) {
+        const ref = this.cache.get(name);
+        const hit = ref && ref.deref();
+        if (hit && hit.isConnected) return hit;
+        const el = predicate
+            ? Array.prototype.find.call(document.querySelectorAll(selector), predicate)
+            : document.querySelector(selector);
+        if (el) this.cache.set(name, new WeakRef(el));
+        else this.cache.delete(name);
+        return el || null;
+    }
+};
+"""
+
 class BrowserController:
     def __init__(self, cdp_url: str = "http://localhost:9222"):
         self.cdp_http_url = cdp_url
@@ -159,8 +179,8 @@ class BrowserController:
             await self._send_cdp("Page.navigate", {"url": url})
             await self._wait_for_load()
     
-    async def open_new_tab(self, url: str = "about:blank"):
-        """Opens a new tab and switches to it."""
+    async def open_new_tab(self, url: str = "about:blank") -> Optional[str]:
+        """Opens a new tab and switches to it. Returns the new target id."""
         logger.info(f"Opening new tab: {url}")
         
         # Use Target.createTarget to create new tab
@@ -183,9 +203,20 @@ class BrowserController:
                             self.websocket = await websockets.connect(new_ws_url)
                             logger.info(f"Switched to new tab: {target_id}")
                             await self._wait_for_load()
-                            return
+                            return target_id
         
         logger.warning("Could not switch to new tab")
+        return target_id
+
+    async def close_tab(self, target_id: str):
+        """Closes a tab by target id (Target.closeTarget, HTTP /json/close fallback)."""
+        try:
+            await self._send_cdp("Target.closeTarget", {"targetId": target_id})
+            return
+        except Exception as e:
+            logger.warning(f"Target.closeTarget failed ({e}), falling back to /json/close")
+        async with httpx.AsyncClient() as client:
+            await client.get(f"{self.cdp_http_url}/json/close/{target_id}")
     
     async def get_tabs(self) -> List[Dict]:
         """Get list of all open tabs."""
@@ -204,6 +235,56 @@ class BrowserController:
             await asyncio.sleep(0.5)
         logger.warning(f"Timeout waiting for page load.")
 
+    async def wait_for_selector(self, selector: str, timeout: float = 10) -> bool:
+        """Resolves as soon as `selector` matches, via an in-page MutationObserver."""
+        safe_selector = json.dumps(selector)
+        script = f"""
+            new Promise(resolve => {{
+                const sel = {safe_selector};
+                if (document.querySelector(sel)) {{ resolve(true); return; }}
+                const obs = new MutationObserver(() => {{
+                    if (document.querySelector(sel)) {{
+                        obs.disconnect();
+                        clearTimeout(limit);
+                        resolve(true);
+                    }}
+                }});
+                const limit = setTimeout(() => {{ obs.disconnect(); resolve(false); }}, {int(timeout * 1000)});
+                obs.observe(document.documentElement, {{childList: true, subtree: true}});
+            }})
+        """
+        return bool(await self.execute_script(script))
+
+    async def wait_for_stable(self, selector: str, quiet_ms: int = 800, timeout: float = 120) -> bool:
+        """
+        Resolves once `selector` exists and the DOM has stopped mutating for `quiet_ms`.
+        Used to detect the end of a streamed response without fixed sleeps.
+        """
+        safe_selector = json.dumps(selector)
+        script = f"""
+            new Promise(resolve => {{
+                const sel = {safe_selector};
+                let quiet = null;
+                const done = (ok) => {{
+                    obs.disconnect();
+                    clearTimeout(quiet);
+                    clearTimeout(limit);
+                    resolve(ok);
+                }};
+                const arm = () => {{
+                    clearTimeout(quiet);
+                    quiet = setTimeout(() => {{
+                        if (document.querySelector(sel)) done(true);
+                    }}, {int(quiet_ms)});
+                }};
+                const obs = new MutationObserver(arm);
+                const limit = setTimeout(() => done(false), {int(timeout * 1000)});
+                obs.observe(document.documentElement, {{childList: true, subtree: true, characterData: true}});
+                arm();
+            }})
+        """
+        return bool(await self.execute_script(script))
+
     async def scrape_text(self, selector: Optional[str] = None) -> str:
         """Scrapes text using JS."""
         if selector:
@@ -267,11 +348,15 @@ class BrowserController:
         # We'll assume the helper methods wrap commands well, or user sends valid expression.
         
         # If the script contains 'return', it likely needs wrapping in IIFE
-        if "return " in script and not script.strip().startswith("(function"):
+        if "return " in script and not script.strip().startswith(("(function", "(async")):
              script = f"(function(){{ {script} }})()"
              
+        return await self._evaluate(script)
+
+    async def _evaluate(self, expression: str) -> Any:
+        """Raw Runtime.evaluate, awaiting promises and returning by value."""
         res = await self._send_cdp("Runtime.evaluate", {
-            "expression": script, 
+            "expression": expression, 
             "returnByValue": True,
             "awaitPromise": True
         })
@@ -279,6 +364,17 @@ class BrowserController:
         val = res.get("result", {}).get("value")
         return val
 
+    async def call_function(self, function: str, *args) -> Any:
+        """
+        Invokes a prebuilt JS function expression with JSON-encoded arguments.
+        Lets callers keep their snippets as constants instead of splicing
+        values into the source on every call. window.__hndl.find is
+        available to the function.
+        """
+        call = f"({function})({', '.join(json.dumps(a) for a in args)})"
+        # The cache installer is a no-op once window.__hndl exists on the page
+        return await self._evaluate(f"{_DOM_CACHE_JS}\n{call}")
+
     async def close(self):
         if self.websocket:
             await self.websocket.close()
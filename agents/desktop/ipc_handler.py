@@ -8,6 +8,8 @@ import os
 import time
 import logging
 import queue
+import ctypes
+from ctypes import wintypes
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -15,10 +17,6 @@ from watchdog.events import FileSystemEventHandler
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from shared.ipc import check_mailbox, IPC_DIR
-import threading
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-from shared.ipc import check_mailbox, get_mailbox_path
 
 try:
     import pyautogui
@@ -36,6 +34,16 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(level
 logger = logging.getLogger("hndl-it.desktop.handler")
 
 
+def cursor_pos():
+    """Current cursor position via user32.GetCursorPos (skips pyautogui's wrapper)."""
+    try:
+        point = wintypes.POINT()
+        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+        return point.x, point.y
+    except AttributeError:
+        return tuple(pyautogui.position())  # Non-Windows
+
+
 class IPCEventHandler(FileSystemEventHandler):
     """Watchdog handler to detect IPC messages."""
 
@@ -85,7 +93,7 @@ def process_command():
                         pyautogui.click(x, y)
                     else:
                         pyautogui.click()
-                    logger.info(f"✅ Clicked at {pyautogui.position()}")
+                    logger.info(f"✅ Clicked at {cursor_pos()}")
 
                 elif action == "screenshot":
                     screenshot = pyautogui.screenshot()
@@ -153,28 +161,7 @@ def main():
     msg_queue.put(True)
 
     running = True
-    process_event = threading.Event()
-    desktop_mailbox_path = get_mailbox_path("desktop")
-    ipc_dir = os.path.dirname(desktop_mailbox_path)
-
-    class IPCHandler(FileSystemEventHandler):
-        def _trigger(self, event_path):
-            if event_path.endswith("desktop.json"):
-                process_event.set()
-
-        def on_created(self, event):
-            self._trigger(event.src_path)
-
-        def on_modified(self, event):
-            self._trigger(event.src_path)
-
-        def on_moved(self, event):
-            self._trigger(event.dest_path)
-
-    observer = Observer()
-    observer.schedule(IPCHandler(), path=ipc_dir, recursive=False)
-    observer.start()
-    logger.info(f"👀 Watching {ipc_dir} for events...")
+    logger.info(f"👀 Watching {IPC_DIR} for events...")
 
     try:
         while running:
@@ -198,20 +185,6 @@ def main():
                 logger.info("Interrupted")
                 running = False
 
-                        
-                    else:
-                        logger.warning(f"Unknown action: {action}")
-                        
-                except Exception as e:
-                    logger.error(f"Error executing {action}: {e}")
-
-                # Check again immediately if we processed something
-                continue
-            
-            # Wait for event
-            process_event.wait(timeout=1.0)
-            process_event.clear()
-            
     except KeyboardInterrupt:
         logger.info("Interrupted")
     finally:
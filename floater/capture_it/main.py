@@ -19,6 +19,10 @@ class SnippingWidget(QWidget):
     """
     captured = pyqtSignal(QPixmap)
     
+    # Repainted on every mouse move while selecting, so keep these prebuilt
+    DIM_COLOR = QColor(0, 0, 0, 100)
+    SELECTION_PEN = QPen(QColor("#00d4ff"), 2)
+    
     def __init__(self):
         super().__init__()
         self.setWindowFlags(
@@ -74,7 +78,7 @@ class SnippingWidget(QWidget):
         painter.drawPixmap(0, 0, self.full_screen_pixmap)
         
         # Draw Dim Overlay
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+        painter.fillRect(self.rect(), self.DIM_COLOR)
         
         # Draw Selection (Clear Rect)
         if self.start_pos and self.current_pos:
@@ -83,8 +87,7 @@ class SnippingWidget(QWidget):
             painter.drawPixmap(rect, self.full_screen_pixmap, rect)
             
             # Draw Border
-            pen = QPen(QColor("#00d4ff"), 2)
-            painter.setPen(pen)
+            painter.setPen(self.SELECTION_PEN)
             painter.drawRect(rect)
             
     def mousePressEvent(self, event):
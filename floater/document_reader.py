@@ -6,6 +6,7 @@ Part of the hndl-it system - Matches Floater UI design language
 import sys
 import os
 import re
+import itertools
 import pyttsx3
 import threading
 from pathlib import Path
@@ -14,8 +15,11 @@ from PyQt6.QtWidgets import (
     QPushButton, QTextEdit, QSlider, QComboBox, QFileDialog,
     QFrame, QScrollArea, QSystemTrayIcon, QMenu, QProgressBar
 )
-from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal, QThread
-from PyQt6.QtGui import QFont, QIcon, QColor, QPalette, QAction
+from PyQt6.QtCore import (
+    Qt, QPoint, QTimer, pyqtSignal, QThread, QObject, QRunnable, QThreadPool,
+    QMutex, QWaitCondition
+)
+from PyQt6.QtGui import QFont, QIcon, QColor, QPalette, QAction, QTextCursor
 import markdown
 
 
@@ -39,6 +43,126 @@ COLORS = {
 }
 
 
+# Panel stylesheet, formatted once at import rather than per apply_styles call
+READER_STYLE = f"""
+    QFrame#container {{
+        background-color: {COLORS['bg_dark']};
+        border: 2px solid {COLORS['lime_primary']};
+        border-radius: 12px;
+    }}
+    
+    QLabel {{
+        color: {COLORS['text_primary']};
+        font-size: 12px;
+    }}
+    
+    QPushButton {{
+        background-color: {COLORS['bg_panel']};
+        color: {COLORS['lime_primary']};
+        border: 1px solid {COLORS['lime_dim']};
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-weight: bold;
+    }}
+    
+    QPushButton:hover {{
+        background-color: {COLORS['lime_dim']};
+        color: {COLORS['bg_dark']};
+        border-color: {COLORS['lime_primary']};
+    }}
+    
+    QTextEdit {{
+        background-color: {COLORS['bg_input']};
+        color: {COLORS['text_primary']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 13px;
+        line-height: 1.6;
+    }}
+    
+    QComboBox {{
+        background-color: {COLORS['bg_input']};
+        color: {COLORS['lime_primary']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 5px;
+        padding: 5px 10px;
+    }}
+    
+    QComboBox::drop-down {{
+        border: none;
+    }}
+    
+    QSlider::groove:horizontal {{
+        background: {COLORS['border']};
+        height: 6px;
+        border-radius: 3px;
+    }}
+    
+    QSlider::handle:horizontal {{
+        background: {COLORS['lime_primary']};
+        width: 16px;
+        height: 16px;
+        margin: -5px 0;
+        border-radius: 8px;
+    }}
+    
+    QProgressBar {{
+        background: {COLORS['border']};
+        border: none;
+        border-radius: 2px;
+    }}
+    
+    QProgressBar::chunk {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {COLORS['lime_dim']}, stop:1 {COLORS['lime_primary']});
+        border-radius: 2px;
+    }}
+"""
+
+TITLE_STYLE = f"color: {COLORS['lime_primary']}; font-weight: bold;"
+DOT_IDLE = f"color: {COLORS['text_secondary']}; font-size: 10px;"
+DOT_PLAYING = f"color: {COLORS['success']}; font-size: 10px;"
+
+DOC_PLACEHOLDER = "📄 Load a document or drag & drop a .md/.txt file..."
+
+
+# Sentence boundary splitter, compiled once for set_text/summarize
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+CHUNK_CHARS = 300       # Target size of one spoken chunk
+FIRST_CHUNK_CHARS = 75  # Opening chunks are smaller, doubling up to CHUNK_CHARS
+
+# (name, id) of installed voices; SAPI enumeration is slow, so query it once
+_VOICES_CACHE = None
+
+
+def iter_chunks(text: str, first_chars: int = CHUNK_CHARS):
+    """Yield (chunk, end offset) pairs of speakable chunks as sentences are found.
+    
+    The size limit starts at `first_chars` and doubles per chunk up to
+    CHUNK_CHARS, so a small first chunk can start speaking sooner.
+    """
+    current = ""
+    start = 0
+    limit = first_chars
+    for sent_end, next_start in itertools.chain(
+        (m.span() for m in _SENT_RE.finditer(text)), [(len(text), len(text))]
+    ):
+        sentence = text[start:sent_end]
+        if len(current) + len(sentence) < limit:
+            current += sentence + " "
+        else:
+            if current.strip():
+                yield current.strip(), start
+                limit = min(limit * 2, CHUNK_CHARS)
+            current = sentence + " "
+        start = next_start
+        
+    if current.strip():
+        yield current.strip(), len(text)
+
+
 # ============================================================================
 # TTS WORKER THREAD
 # ============================================================================
@@ -48,34 +172,55 @@ class TTSWorker(QThread):
     chunk_started = pyqtSignal(int)
     finished_speaking = pyqtSignal()
     
+    TICK_MS = 20         # Engine pump interval while speaking; bounds stop/skip latency
+    LOOKAHEAD = 2        # Chunks handed to the engine ahead of the one playing
+    
     def __init__(self):
         super().__init__()
         self.engine = pyttsx3.init()
-        self.chunks = []
+        self.engine.connect('started-utterance', self._on_utterance_started)
+        self.engine.connect('finished-utterance', self._on_utterance_finished)
+        self.chunks = []          # Chunks split so far; grows as playback advances
+        self._chunk_iter = None   # Producer for the rest; None once exhausted
+        self._text_len = 0
+        self._split_pos = 0       # Offset in the text the producer has reached
+        self._queued_upto = 0     # Chunks below this index are queued on the engine
         self.current_chunk = 0
         self.is_playing = False
         self.is_paused = False
         self._stop_flag = False
+        self._requeue = False  # Set by controls; loop re-queues from current_chunk
+        self._top_up = False   # Set when a chunk finishes; loop queues the next one
+        self._skip = 0         # Pending skip (+fwd/-back) from the GUI; applied by the loop
+        self._pause_mutex = QMutex()
+        self._pause_cond = QWaitCondition()  # Woken by resume()/stop()
         
     def set_text(self, text: str):
-        """Split text into speakable chunks"""
-        # Split by sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        """Prepare text for reading; chunks are split lazily as playback needs them"""
         self.chunks = []
-        current = ""
-        
-        for sentence in sentences:
-            if len(current) + len(sentence) < 300:
-                current += sentence + " "
-            else:
-                if current.strip():
-                    self.chunks.append(current.strip())
-                current = sentence + " "
-        
-        if current.strip():
-            self.chunks.append(current.strip())
-        
+        self._chunk_iter = iter_chunks(text, FIRST_CHUNK_CHARS)
+        self._text_len = len(text)
+        self._split_pos = 0
+        self._queued_upto = 0
         self.current_chunk = 0
+        self._skip = 0
+        
+    def _has_chunk(self, index: int) -> bool:
+        """Split more of the text until chunk `index` exists (or the text runs out)"""
+        while index >= len(self.chunks) and self._chunk_iter is not None:
+            try:
+                chunk, self._split_pos = next(self._chunk_iter)
+                self.chunks.append(chunk)
+            except StopIteration:
+                self._chunk_iter = None
+        return index < len(self.chunks)
+        
+    def total_chunks(self) -> int:
+        """Chunk count - exact once the text is fully split, estimated before that"""
+        if self._chunk_iter is None:
+            return len(self.chunks)
+        remaining = self._text_len - self._split_pos
+        return len(self.chunks) + max(1, -(-remaining // CHUNK_CHARS))
         
     def set_rate(self, rate: int):
         """Set speech rate (words per minute)"""
@@ -86,55 +231,167 @@ class TTSWorker(QThread):
         self.engine.setProperty('voice', voice_id)
         
     def get_voices(self):
-        """Get available voices"""
-        return self.engine.getProperty('voices')
+        """Get available voices as (name, id) pairs (cached per process)"""
+        global _VOICES_CACHE
+        if _VOICES_CACHE is None:
+            _VOICES_CACHE = [(v.name, v.id) for v in self.engine.getProperty('voices')]
+        return _VOICES_CACHE
+    
+    def _on_utterance_started(self, name):
+        """Engine callback - utterances are named by chunk index"""
+        index = int(name)
+        self.chunk_started.emit(index)
+        self.progress_updated.emit(index + 1, self.total_chunks())
+        
+    def _on_utterance_finished(self, name, completed):
+        """Engine callback - advance only when a chunk was spoken to the end"""
+        if completed:
+            self.current_chunk = int(name) + 1
+            self._top_up = True
+    
+    def _queue_ahead(self):
+        """Queue chunks up to LOOKAHEAD past current_chunk, splitting them on demand"""
+        end = self.current_chunk + self.LOOKAHEAD + 1
+        while self._queued_upto < end and self._has_chunk(self._queued_upto):
+            self.engine.say(self.chunks[self._queued_upto], str(self._queued_upto))
+            self._queued_upto += 1
+    
+    def _queue_remaining(self):
+        """Drop whatever the engine has queued and queue from current_chunk"""
+        self.engine.stop()
+        self._queued_upto = self.current_chunk
+        if not self.is_paused:
+            self._queue_ahead()
     
     def run(self):
-        """Main TTS loop"""
+        """Main TTS loop - pumps the engine's event loop instead of blocking per chunk"""
         self._stop_flag = False
         self.is_playing = True
+        self._requeue = True
         
-        while self.current_chunk < len(self.chunks) and not self._stop_flag:
-            if self.is_paused:
-                self.msleep(100)
-                continue
-                
-            self.chunk_started.emit(self.current_chunk)
-            self.progress_updated.emit(self.current_chunk + 1, len(self.chunks))
-            
-            self.engine.say(self.chunks[self.current_chunk])
-            self.engine.runAndWait()
-            
-            self.current_chunk += 1
+        self.engine.startLoop(False)
+        try:
+            while self._has_chunk(self.current_chunk) and not self._stop_flag:
+                if self._skip:
+                    self._apply_skip()
+                if self._requeue:
+                    self._requeue = False
+                    self._top_up = False
+                    self._queue_remaining()
+                elif self._top_up:
+                    self._top_up = False
+                    self._queue_ahead()
+                if self.is_paused:
+                    # Engine was stopped by the requeue above; sleep until woken
+                    self._pause_mutex.lock()
+                    while self.is_paused and not self._stop_flag:
+                        self._pause_cond.wait(self._pause_mutex)
+                    self._pause_mutex.unlock()
+                    continue
+                self.engine.iterate()
+                self.msleep(self.TICK_MS)
+        finally:
+            self.engine.stop()
+            self.engine.endLoop()
             
         self.is_playing = False
         self.finished_speaking.emit()
         
     def stop(self):
-        """Stop speaking"""
+        """Stop speaking (takes effect on the next engine tick)"""
+        self._pause_mutex.lock()
         self._stop_flag = True
-        self.engine.stop()
         self.is_playing = False
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         
     def pause(self):
-        """Pause speaking"""
+        """Pause speaking mid-chunk; resume restarts the current chunk"""
+        self._pause_mutex.lock()
         self.is_paused = True
+        self._requeue = True
+        self._pause_mutex.unlock()
         
     def resume(self):
         """Resume speaking"""
+        self._pause_mutex.lock()
         self.is_paused = False
+        self._requeue = True
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         
     def skip_forward(self):
-        """Skip to next chunk"""
-        if self.current_chunk < len(self.chunks) - 1:
-            self.current_chunk += 1
-            self.engine.stop()
+        """Skip to next chunk (applied by the worker loop on its next tick)"""
+        self._pause_mutex.lock()
+        self._skip += 1
+        self._pause_mutex.unlock()
             
     def skip_back(self):
-        """Skip to previous chunk"""
-        if self.current_chunk > 0:
-            self.current_chunk -= 1
-            self.engine.stop()
+        """Skip to previous chunk (applied by the worker loop on its next tick)"""
+        self._pause_mutex.lock()
+        self._skip -= 1
+        self._pause_mutex.unlock()
+        
+    def _apply_skip(self):
+        """Worker thread only: move current_chunk by the pending skips.
+        
+        Only this thread touches the chunk producer and current_chunk, so GUI
+        clicks can't race the loop's splitting or the engine callbacks.
+        """
+        self._pause_mutex.lock()
+        delta, self._skip = self._skip, 0
+        self._pause_mutex.unlock()
+        target = self.current_chunk
+        while delta > 0 and self._has_chunk(target + 1):
+            target += 1
+            delta -= 1
+        target = max(0, target + min(delta, 0))
+        if target != self.current_chunk:
+            self.current_chunk = target
+            self._requeue = True
+
+
+# ============================================================================
+# FILE LOADING
+# ============================================================================
+class FileReadSignals(QObject):
+    """Signals for FileReadWorker (QRunnable can't own signals itself)"""
+    chunk = pyqtSignal(str, str)        # path, next block of plain text
+    done = pyqtSignal(str)              # path; plain text fully streamed
+    loaded = pyqtSignal(str, str, str)  # path, text, html (markdown only)
+    failed = pyqtSignal(str, str)       # path, error
+
+
+class FileReadWorker(QRunnable):
+    """Read a document off the GUI thread.
+    
+    Plain text is streamed in CHUNK_SIZE blocks so the first page shows
+    immediately; markdown has to be read whole to be rendered to HTML.
+    """
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.cancelled = False  # Set when a newer load supersedes this one
+        self.signals = FileReadSignals()
+        
+    def run(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                if self.path.endswith(('.md', '.markdown')):
+                    content = f.read()
+                    self.signals.loaded.emit(self.path, content, markdown.markdown(content))
+                    return
+                while not self.cancelled:
+                    data = f.read(self.CHUNK_SIZE)
+                    if not data:
+                        break
+                    self.signals.chunk.emit(self.path, data)
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+            return
+        self.signals.done.emit(self.path)
 
 
 # ============================================================================
@@ -148,6 +405,9 @@ class DocumentReader(QWidget):
         self.is_expanded = False
         self.document_text = ""
         self.drag_position = None
+        self._file_worker = None  # Latest load; older results are ignored
+        self._loading_parts = None
+        self._shown_doc = None    # (text, is_html) currently in doc_area
         
         # TTS
         self.tts_worker = TTSWorker()
@@ -155,6 +415,27 @@ class DocumentReader(QWidget):
         self.tts_worker.chunk_started.connect(self.highlight_chunk)
         self.tts_worker.finished_speaking.connect(self.on_finished)
         
+        # Reusable timer that restores the title after a status flash
+        self._base_title = "📄 Doc Reader"  # What a flash_title() restores
+        self.title_reset_timer = QTimer(self)
+        self.title_reset_timer.setSingleShot(True)
+        self.title_reset_timer.setInterval(2000)
+        self.title_reset_timer.timeout.connect(lambda: self.title_label.setText(self._base_title))
+        
+        # Debounce speed-slider drags into one engine rate change once it settles
+        self.rate_timer = QTimer(self)
+        self.rate_timer.setSingleShot(True)
+        self.rate_timer.setInterval(75)
+        self.rate_timer.timeout.connect(lambda: self.tts_worker.set_rate(self.speed_slider.value()))
+        
+        # Coalesce progress signals into at most 10 repaints/sec
+        self._pending_progress = None  # (current, total) not yet shown
+        self._last_pct = -1
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.setInterval(100)
+        self.progress_timer.timeout.connect(self._flush_progress)
+        
         self.init_ui()
         self.setup_tray()
         
@@ -203,13 +484,15 @@ class DocumentReader(QWidget):
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximumHeight(4)
+        self.progress_bar.setMaximum(100)  # Percent
         self.progress_bar.setTextVisible(False)
         expanded_layout.addWidget(self.progress_bar)
         
         # Document area
         self.doc_area = QTextEdit()
         self.doc_area.setReadOnly(True)
-        self.doc_area.setPlaceholderText("📄 Load a document or drag & drop a .md/.txt file...")
+        self.doc_area.setUndoRedoEnabled(False)  # Read-only view; no undo history to keep
+        self.doc_area.setPlaceholderText(DOC_PLACEHOLDER)
         expanded_layout.addWidget(self.doc_area)
         
         # Bottom actions
@@ -239,12 +522,12 @@ class DocumentReader(QWidget):
         # Status dot
         self.status_dot = QLabel("●")
         self.status_dot.setFixedSize(14, 14)
-        self.status_dot.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px;")
+        self.status_dot.setStyleSheet(DOT_IDLE)
         layout.addWidget(self.status_dot)
         
         # Title
         self.title_label = QLabel("📄 Doc Reader")
-        self.title_label.setStyleSheet(f"color: {COLORS['lime_primary']}; font-weight: bold;")
+        self.title_label.setStyleSheet(TITLE_STYLE)
         layout.addWidget(self.title_label, 1)
         
         # Expand button
@@ -367,87 +650,18 @@ class DocumentReader(QWidget):
     def load_voices(self):
         """Load available TTS voices"""
         voices = self.tts_worker.get_voices()
-        for voice in voices:
-            name = voice.name.replace("Microsoft ", "")[:30]
-            self.voice_combo.addItem(name, voice.id)
+        self.voice_combo.blockSignals(True)
+        self.voice_combo.setUpdatesEnabled(False)
+        # One model insert for all names, then attach ids, instead of addItem per voice
+        self.voice_combo.addItems([name.replace("Microsoft ", "")[:30] for name, _ in voices])
+        for i, (_, voice_id) in enumerate(voices):
+            self.voice_combo.setItemData(i, voice_id)
+        self.voice_combo.setUpdatesEnabled(True)
+        self.voice_combo.blockSignals(False)
             
     def apply_styles(self):
         """Apply the hndl-it lime theme"""
-        self.setStyleSheet(f"""
-            QFrame#container {{
-                background-color: {COLORS['bg_dark']};
-                border: 2px solid {COLORS['lime_primary']};
-                border-radius: 12px;
-            }}
-            
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 12px;
-            }}
-            
-            QPushButton {{
-                background-color: {COLORS['bg_panel']};
-                color: {COLORS['lime_primary']};
-                border: 1px solid {COLORS['lime_dim']};
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }}
-            
-            QPushButton:hover {{
-                background-color: {COLORS['lime_dim']};
-                color: {COLORS['bg_dark']};
-                border-color: {COLORS['lime_primary']};
-            }}
-            
-            QTextEdit {{
-                background-color: {COLORS['bg_input']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 13px;
-                line-height: 1.6;
-            }}
-            
-            QComboBox {{
-                background-color: {COLORS['bg_input']};
-                color: {COLORS['lime_primary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 5px;
-                padding: 5px 10px;
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            
-            QSlider::groove:horizontal {{
-                background: {COLORS['border']};
-                height: 6px;
-                border-radius: 3px;
-            }}
-            
-            QSlider::handle:horizontal {{
-                background: {COLORS['lime_primary']};
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }}
-            
-            QProgressBar {{
-                background: {COLORS['border']};
-                border: none;
-                border-radius: 2px;
-            }}
-            
-            QProgressBar::chunk {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['lime_dim']}, stop:1 {COLORS['lime_primary']});
-                border-radius: 2px;
-            }}
-        """)
+        self.setStyleSheet(READER_STYLE)
         
     def update_size(self):
         """Update window size based on state"""
@@ -458,10 +672,15 @@ class DocumentReader(QWidget):
             
     def toggle_expand(self):
         """Toggle between collapsed and expanded"""
-        self.is_expanded = not self.is_expanded
-        self.expanded_frame.setVisible(self.is_expanded)
-        self.expand_btn.setText("⬇" if self.is_expanded else "⬆")
-        self.update_size()
+        # Batch visibility + resize into one repaint instead of one per change
+        self.setUpdatesEnabled(False)
+        try:
+            self.is_expanded = not self.is_expanded
+            self.expanded_frame.setVisible(self.is_expanded)
+            self.expand_btn.setText("⬇" if self.is_expanded else "⬆")
+            self.update_size()
+        finally:
+            self.setUpdatesEnabled(True)
         
     def setup_tray(self):
         """Setup system tray icon"""
@@ -505,10 +724,7 @@ class DocumentReader(QWidget):
     
     def toggle_play(self):
         """Toggle play/pause"""
-        if not self.document_text:
-            self.title_label.setText("📄 Load a document first!")
-            return
-            
+        # Pause/resume works on the worker's own copy of the text, even mid-reload
         if self.tts_worker.is_playing:
             if self.tts_worker.is_paused:
                 self.tts_worker.resume()
@@ -516,8 +732,14 @@ class DocumentReader(QWidget):
             else:
                 self.tts_worker.pause()
                 self.update_play_buttons(False, paused=True)
-        else:
-            self.start_reading()
+            return
+            
+        if self._busy_loading():
+            return
+        if not self.document_text:
+            self.title_label.setText("📄 Load a document first!")
+            return
+        self.start_reading()
             
     def start_reading(self):
         """Start reading the document"""
@@ -529,15 +751,16 @@ class DocumentReader(QWidget):
             self.tts_worker.set_voice(voice_id)
             
         self.update_play_buttons(True)
-        self.status_dot.setStyleSheet(f"color: {COLORS['success']}; font-size: 10px;")
+        self.status_dot.setStyleSheet(DOT_PLAYING)
+        self.reset_progress()
         self.tts_worker.start()
         
     def stop_reading(self):
         """Stop reading"""
         self.tts_worker.stop()
         self.update_play_buttons(False)
-        self.status_dot.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px;")
-        self.progress_bar.setValue(0)
+        self.status_dot.setStyleSheet(DOT_IDLE)
+        self.reset_progress()
         
     def skip_forward(self):
         """Skip forward"""
@@ -560,13 +783,33 @@ class DocumentReader(QWidget):
         """Update speed display"""
         rate = value / 175.0
         self.speed_label.setText(f"{rate:.1f}x")
-        self.tts_worker.set_rate(value)
+        self.rate_timer.start()
         
     def update_progress(self, current, total):
-        """Update progress bar"""
-        self.progress_bar.setMaximum(total)
-        self.progress_bar.setValue(current)
-        self.title_label.setText(f"📄 {current}/{total}")
+        """Update progress bar (throttled, see _flush_progress)"""
+        self._pending_progress = (current, total)
+        if not self.progress_timer.isActive():
+            self.progress_timer.start()
+            
+    def reset_progress(self):
+        """Drop pending progress and empty the bar (no repaint if already empty)"""
+        self.progress_timer.stop()
+        self._pending_progress = None
+        if self._last_pct != 0:
+            self._last_pct = 0
+            self.progress_bar.setValue(0)
+            
+    def _flush_progress(self):
+        """Show the latest progress, repainting the bar only when the percent changes"""
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
+        pct = int(current * 100 / total) if total else 0
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress_bar.setValue(pct)
+        self.set_title(f"📄 {current}/{total}")
         
     def highlight_chunk(self, index):
         """Highlight current chunk being read"""
@@ -575,9 +818,11 @@ class DocumentReader(QWidget):
         
     def on_finished(self):
         """Called when TTS finishes"""
+        self.progress_timer.stop()
+        self._flush_progress()  # Show final progress before the title resets
         self.update_play_buttons(False)
-        self.status_dot.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px;")
-        self.title_label.setText("📄 Doc Reader")
+        self.status_dot.setStyleSheet(DOT_IDLE)
+        self.set_title("📄 Doc Reader")
         
     # ========================================================================
     # DOCUMENT HANDLING
@@ -594,51 +839,122 @@ class DocumentReader(QWidget):
             self.load_document(file_path)
             
     def load_document(self, file_path: str):
-        """Load document from path"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            self.document_text = content
-            
-            # Convert markdown to HTML for display
-            if file_path.endswith(('.md', '.markdown')):
-                html = markdown.markdown(content)
-                self.doc_area.setHtml(html)
-            else:
-                self.doc_area.setPlainText(content)
-                
-            # Update title
-            name = Path(file_path).name[:20]
-            self.title_label.setText(f"📄 {name}")
+        """Load document from path (read in the thread pool by FileReadWorker)"""
+        if self._file_worker is not None:
+            self._file_worker.cancelled = True
+        self.doc_area.setPlaceholderText("⏳ Loading...")
+        self._loading_parts = None  # Plain-text blocks received so far
+        # The previous document is being replaced; don't let actions use it
+        self.document_text = ""
+        
+        worker = FileReadWorker(file_path)
+        worker.signals.chunk.connect(self._on_document_chunk)
+        worker.signals.done.connect(self._on_document_done)
+        worker.signals.loaded.connect(self._on_document_loaded)
+        worker.signals.failed.connect(self._on_document_failed)
+        self._file_worker = worker
+        QThreadPool.globalInstance().start(worker)
+        
+    def _busy_loading(self) -> bool:
+        """True (and says so in the title) while a document is still being read"""
+        if self._file_worker is None:
+            return False
+        self.flash_title("⏳ Still loading...")
+        return True
+        
+    def _is_current_load(self) -> bool:
+        """False for results from a load that a newer one superseded"""
+        return self._file_worker is not None and self.sender() is self._file_worker.signals
+        
+    def _show_loaded_name(self, file_path: str):
+        """Title + auto-expand once a document starts showing"""
+        self.doc_area.setPlaceholderText(DOC_PLACEHOLDER)
+        name = Path(file_path).name[:20]
+        self.set_title(f"📄 {name}")
+        if not self.is_expanded:
+            self.toggle_expand()
+        
+    def _on_document_chunk(self, file_path: str, data: str):
+        """Append the next streamed block of a plain-text document"""
+        if not self._is_current_load():
+            return
+        if self._loading_parts is None:
+            # First block: replace whatever was showing
+            self._loading_parts = []
+            self._shown_doc = None
+            self.doc_area.clear()
+            self._show_loaded_name(file_path)
+        self._loading_parts.append(data)
+        # Append through a document cursor: the view's cursor (and scroll position)
+        # stays at the top instead of chasing every block to the end
+        cursor = QTextCursor(self.doc_area.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(data)
+        
+    def _on_document_done(self, file_path: str):
+        """A plain-text document finished streaming"""
+        if not self._is_current_load():
+            return
+        self._file_worker = None
+        if self._loading_parts is None:  # Empty file
+            self._loading_parts = []
+            self.show_document("")
+            self._show_loaded_name(file_path)
+        self.document_text = "".join(self._loading_parts)
+        self._loading_parts = None
+        self._shown_doc = (self.document_text, False)
+        
+    def _on_document_loaded(self, file_path: str, content: str, html: str):
+        """Show a markdown document read and rendered by FileReadWorker"""
+        if not self._is_current_load():
+            return
+        self._file_worker = None
+        self.document_text = content
+        self.show_document(html, is_html=True)
+        self._show_loaded_name(file_path)
             
-            # Auto-expand
-            if not self.is_expanded:
-                self.toggle_expand()
-                
-        except Exception as e:
-            self.doc_area.setPlainText(f"Error loading file: {e}")
+    def _on_document_failed(self, file_path: str, error: str):
+        """Show a FileReadWorker error"""
+        if not self._is_current_load():
+            return
+        self._file_worker = None
+        self._loading_parts = None
+        self.doc_area.setPlaceholderText(DOC_PLACEHOLDER)
+        self.show_document(f"Error loading file: {error}")
             
     def summarize(self):
         """Generate a simple summary"""
-        if not self.document_text:
+        if self._busy_loading() or not self.document_text:
             return
             
         # Simple extractive summary - first 3 sentences
-        sentences = re.split(r'(?<=[.!?])\s+', self.document_text)
+        sentences = _SENT_RE.split(self.document_text)
         summary = ' '.join(sentences[:3])
         
-        self.doc_area.setPlainText(f"📝 SUMMARY:\n\n{summary}\n\n---\n\n{self.document_text}")
+        self.show_document(f"📝 SUMMARY:\n\n{summary}\n\n---\n\n{self.document_text}")
+        
+    def show_document(self, text: str, is_html: bool = False):
+        """Set the document view, skipping the re-layout if it already shows this text"""
+        if self._shown_doc == (text, is_html):
+            return
+        self._shown_doc = (text, is_html)
+        if is_html:
+            self.doc_area.setHtml(text)
+        else:
+            self.doc_area.setPlainText(text)
         
     def copy_all(self):
         """Copy document to clipboard"""
+        if self._busy_loading():
+            return
         clipboard = QApplication.clipboard()
         clipboard.setText(self.document_text or self.doc_area.toPlainText())
-        self.title_label.setText("📋 Copied!")
-        QTimer.singleShot(2000, lambda: self.title_label.setText("📄 Doc Reader"))
+        self.flash_title("📋 Copied!")
         
     def export_doc(self):
         """Export document"""
+        if self._busy_loading():
+            return
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Document", "exported_document.md",
             "Markdown (*.md);;Text (*.txt)"
@@ -647,8 +963,18 @@ class DocumentReader(QWidget):
         if file_path:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(self.document_text or self.doc_area.toPlainText())
-            self.title_label.setText("📤 Exported!")
-            QTimer.singleShot(2000, lambda: self.title_label.setText("📄 Doc Reader"))
+            self.flash_title("📤 Exported!")
+            
+    def set_title(self, text: str):
+        """Set the lasting title; a status flash in progress keeps showing until it ends"""
+        self._base_title = text
+        if not self.title_reset_timer.isActive():
+            self.title_label.setText(text)
+        
+    def flash_title(self, text: str):
+        """Show a status in the title briefly, then restore the current title"""
+        self.title_label.setText(text)
+        self.title_reset_timer.start()
             
     # ========================================================================
     # DRAG & DROP
@@ -102,8 +102,10 @@ def main():
     overlay.clicked.connect(toggle_input)
     overlay.double_clicked.connect(lambda: console.show() or console.raise_() or console.activateWindow())
     
-    # IPC Listener
-    from PyQt6.QtCore import QTimer
+    # IPC Listener - file change notifications, with a slow fallback poll
+    from PyQt6.QtCore import QTimer, QFileSystemWatcher
+    from shared.ipc import IPC_DIR
+    ipc_watcher = QFileSystemWatcher([IPC_DIR])
     ipc_timer = QTimer()
     
     def check_ipc_handler():
@@ -120,8 +122,9 @@ def main():
         except Exception:
             pass
 
+    ipc_watcher.directoryChanged.connect(lambda _path: check_ipc_handler())
     ipc_timer.timeout.connect(check_ipc_handler)
-    ipc_timer.start(1000)
+    ipc_timer.start(5000)
     
     logger.info("Floater UI initialized. Listening on IPC 'hndl'.")
     sys.exit(app.exec())
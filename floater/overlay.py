@@ -1,10 +1,13 @@
+import os
 import logging
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QWidget, QMenu, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRectF
-from PyQt6.QtGui import QPainter, QColor, QRadialGradient, QBrush, QPen, QCursor
+from PyQt6.QtGui import QPainter, QColor, QRadialGradient, QBrush, QPen, QCursor, QAction, QPixmap, QPainterPath, QPixmapCache
 
 logger = logging.getLogger("hndl-it.floater.overlay")
 
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
 class OverlayWidget(QWidget):
     """
     A persistent, always-on-top floating icon.
@@ -31,70 +34,107 @@ class OverlayWidget(QWidget):
         self._drag_pos = QPoint()
         self._dragging = False
         
+        # Try to load icon once (Prefer jpg, then png); it is scaled when
+        # composited for the screen's device pixel ratio
+        self._pixmap = None
+        for fname in ("icon.jpg", "icon.png"):
+            pixmap = QPixmap(os.path.join(ASSETS_DIR, fname))
+            if not pixmap.isNull():  # Missing/unreadable files load as null
+                self._pixmap = pixmap
+                break
+        
+        self._clip_path = QPainterPath()
+        self._clip_path.addEllipse(0.0, 0.0, float(self.size_val), float(self.size_val))
+        self._border_pen = QPen(QColor("#007acc")) # Blue accent
+        self._border_pen.setWidth(3)
+        self._composited = None  # Final icon, built on first paint
+        
         # Initial Position (Bottom Rightish)
         # We can't easily guess screen geometry here easily without app ref, 
         # so let main set logic or default to 100,100
         self.move(100, 100) 
         
     def paintEvent(self, event):
+        # Icon, circular mask and border are composited once per device pixel
+        # ratio (re-done if the overlay moves to a screen with another scale)
+        dpr = self.devicePixelRatioF()
+        if self._composited is None or self._composited.devicePixelRatio() != dpr:
+            if self._pixmap is not None:
+                self._composited = self._render_icon_pixmap(dpr)
+            else:
+                # Fallback is pixel-identical between instances; share it via QPixmapCache
+                key = f"hndl-it/overlay-fallback/{self.size_val}/{dpr}"
+                self._composited = QPixmapCache.find(key)
+                if self._composited is None:
+                    self._composited = self._render_fallback_pixmap(dpr)
+                    QPixmapCache.insert(key, self._composited)
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._composited)
+
+    def _new_canvas(self, dpr: float) -> QPixmap:
+        # Backed by device pixels so the icon stays sharp on HiDPI screens;
+        # painters on it still work in logical (widget) coordinates
+        side = round(self.size_val * dpr)
+        pixmap = QPixmap(side, side)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+        
+    def _render_icon_pixmap(self, dpr: float) -> QPixmap:
+        pixmap = self._new_canvas(dpr)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Try to load icon (Prefer jpg, then png)
-        import os
-        from PyQt6.QtGui import QPixmap, QPainterPath
+        # Draw Circular Clipped Icon
+        painter.setClipPath(self._clip_path)
         
-        icon_path = ""
-        possible_icons = ["icon.jpg", "icon.png"]
-        for fname in possible_icons:
-            path = os.path.join(os.path.dirname(__file__), "assets", fname)
-            if os.path.exists(path):
-                icon_path = path
-                break
+        # Draw user image, scaled to device pixels
+        side = round(self.size_val * dpr)
+        icon = self._pixmap.scaled(
+            side, side,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        icon.setDevicePixelRatio(dpr)
+        painter.drawPixmap(0, 0, icon)
+        
+        # Draw border over it again for crispness
+        painter.setClipping(False) # Turn off clipping for border
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(self._border_pen)
+        painter.drawEllipse(3, 3, self.size_val-6, self.size_val-6)
+        painter.end()
+        return pixmap
+        
+    def _render_fallback_pixmap(self, dpr: float) -> QPixmap:
+        pixmap = self._new_canvas(dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Gradient Circle
+        center = self.size_val / 2
+        gradient = QRadialGradient(center, center, self.size_val / 2)
+        gradient.setColorAt(0, QColor("#333333"))
+        gradient.setColorAt(1, QColor("#111111"))
+        
+        painter.setBrush(QBrush(gradient))
+        
+        # Border
+        painter.setPen(self._border_pen)
+        
+        # Draw Circle
+        rect = QRectF(3, 3, self.size_val-6, self.size_val-6)
+        painter.drawEllipse(rect)
         
-        if icon_path:
-            pixmap = QPixmap(icon_path)
-            
-            # Draw Circular Clipped Icon
-            path = QPainterPath()
-            path.addEllipse(0, 0, self.width(), self.height())
-            painter.setClipPath(path)
-            
-            # Draw user image
-            painter.drawPixmap(self.rect(), pixmap)
-            
-            # Draw border over it again for crispness
-            painter.setClipping(False) # Turn off clipping for border
-            pen = QPen(QColor("#007acc"))
-            pen.setWidth(3)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.setPen(pen)
-            painter.drawEllipse(3, 3, self.width()-6, self.height()-6)
-            
-        else:
-            # Fallback to Gradient Circle
-            gradient = QRadialGradient(self.rect().center(), self.width() / 2)
-            gradient.setColorAt(0, QColor("#333333"))
-            gradient.setColorAt(1, QColor("#111111"))
-            
-            painter.setBrush(QBrush(gradient))
-            
-            # Border
-            pen = QPen(QColor("#007acc")) # Blue accent
-            pen.setWidth(3)
-            painter.setPen(pen)
-            
-            # Draw Circle
-            rect = QRectF(3, 3, self.width()-6, self.height()-6)
-            painter.drawEllipse(rect)
-            
-            # Draw "H"
-            painter.setPen(QColor("#ffffff"))
-            font = painter.font()
-            font.setBold(True)
-            font.setPointSize(14)
-            painter.setFont(font)
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "H")
+        # Draw "H"
+        painter.setPen(QColor("#ffffff"))
+        font = painter.font()
+        font.setBold(True)
+        font.setPointSize(14)
+        painter.setFont(font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "H")
+        painter.end()
+        return pixmap
         
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -126,8 +166,6 @@ class OverlayWidget(QWidget):
         self.double_clicked.emit()
 
     def contextMenuEvent(self, event):
-        from PyQt6.QtWidgets import QMenu, QApplication
-        from PyQt6.QtGui import QAction
         menu = QMenu(self)
         
         close_action = QAction("Close", self)
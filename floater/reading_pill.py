@@ -15,6 +15,7 @@ import os
 import re
 import pyttsx3
 import threading
+import queue
 import requests
 import time
 from pathlib import Path
@@ -40,41 +41,86 @@ COLORS = {
     'border': '#3a3a3a',
 }
 
+# Stylesheets, formatted once at import rather than on every apply/show
+PILL_STYLE = f"""
+    QWidget {{
+        background-color: {COLORS['bg_dark']};
+        border: 2px solid {COLORS['lime_primary']};
+        border-radius: 22px;
+    }}
+    
+    QPushButton {{
+        background-color: {COLORS['bg_panel']};
+        color: {COLORS['lime_primary']};
+        border: 1px solid {COLORS['lime_dim']};
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    
+    QPushButton:hover {{
+        background-color: {COLORS['lime_dim']};
+        color: {COLORS['bg_dark']};
+    }}
+    
+    QPushButton:pressed {{
+        background-color: {COLORS['lime_primary']};
+    }}
+"""
+
+DOT_IDLE = f"color: {COLORS['lime_dim']}; font-size: 8px;"
+DOT_READY = f"color: {COLORS['lime_primary']}; font-size: 8px;"
+DOT_PLAYING = "color: #44ff66; font-size: 8px;"      # Green = playing
+DOT_PROCESSING = "color: #ffaa00; font-size: 8px;"   # Orange = processing
+
 # Ollama settings (local-first)
 OLLAMA_URL = "http://localhost:11434/api/generate"
 OLLAMA_MODEL = "llama3.2:3b"  # Fast local model
 
+# Sentence boundary splitter for the extractive summary fallback
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 # ============================================================================
 # TTS ENGINE (Local)
 # ============================================================================
 class TTSEngine:
-    """Local text-to-speech engine"""
+    """Local text-to-speech engine, driven by one long-lived worker thread"""
     
     def __init__(self):
         self.engine = pyttsx3.init()
         self.engine.setProperty('rate', 175)
         self.is_speaking = False
-        self._thread = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
         
     def speak(self, text: str):
-        """Speak text in background thread"""
-        if self.is_speaking:
+        """Queue text for the worker; interrupts anything already playing"""
+        if self.is_speaking or not self._queue.empty():
             self.stop()
-            
-        self._thread = threading.Thread(target=self._speak_thread, args=(text,))
-        self._thread.daemon = True
-        self._thread.start()
-        
-    def _speak_thread(self, text: str):
-        """Background speaking thread"""
-        self.is_speaking = True
-        self.engine.say(text)
-        self.engine.runAndWait()
-        self.is_speaking = False
+        self._queue.put(text)
+        
+    def _run(self):
+        """Worker loop - owns runAndWait so callers never block on speech"""
+        while True:
+            text = self._queue.get()
+            self.is_speaking = True
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"TTS error: {e}")
+            finally:
+                self.is_speaking = False
         
     def stop(self):
-        """Stop speaking"""
+        """Stop speaking and drop anything still queued"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
         self.engine.stop()
         self.is_speaking = False
         
@@ -129,7 +175,7 @@ Only return the corrected text, nothing else:
         """Summarize text using local LLM"""
         if not OllamaClient.is_available():
             # Fallback: extractive summary
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+            sentences = _SENT_RE.split(text)
             return ' '.join(sentences[:3]) if sentences else text[:200]
             
         prompt = f"""Summarize this text in 2-3 concise sentences:
@@ -152,7 +198,7 @@ Summary:"""
             pass
             
         # Fallback
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENT_RE.split(text)
         return ' '.join(sentences[:3]) if sentences else text[:200]
 
 
@@ -169,10 +215,17 @@ class ReadingPill(QWidget):
         
         self.current_text = ""
         self.last_clipboard = ""
-        self.tts = TTSEngine()
+        self._tts = None  # Created on first play; pyttsx3.init() is slow
         self.drag_position = None
         self.is_processing = False
         
+        # One reusable auto-hide timer, restarted on every show instead of
+        # stacking a new single-shot per clipboard event
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.setInterval(30000)
+        self.hide_timer.timeout.connect(self.auto_hide)
+        
         self.init_ui()
         self.setup_clipboard_monitor()
         self.setup_tray()
@@ -197,7 +250,7 @@ class ReadingPill(QWidget):
         
         # Status indicator
         self.status_dot = QLabel("●")
-        self.status_dot.setStyleSheet(f"color: {COLORS['lime_dim']}; font-size: 8px;")
+        self.status_dot.setStyleSheet(DOT_IDLE)
         layout.addWidget(self.status_dot)
         
         # Play button
@@ -243,31 +296,7 @@ class ReadingPill(QWidget):
         
     def apply_styles(self):
         """Apply hndl-it lime theme"""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['bg_dark']};
-                border: 2px solid {COLORS['lime_primary']};
-                border-radius: 22px;
-            }}
-            
-            QPushButton {{
-                background-color: {COLORS['bg_panel']};
-                color: {COLORS['lime_primary']};
-                border: 1px solid {COLORS['lime_dim']};
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            
-            QPushButton:hover {{
-                background-color: {COLORS['lime_dim']};
-                color: {COLORS['bg_dark']};
-            }}
-            
-            QPushButton:pressed {{
-                background-color: {COLORS['lime_primary']};
-            }}
-        """)
+        self.setStyleSheet(PILL_STYLE)
         
     def position_pill(self):
         """Position pill at top-right of screen"""
@@ -298,21 +327,29 @@ class ReadingPill(QWidget):
         
     def show_pill(self):
         """Show the pill with animation"""
-        self.status_dot.setStyleSheet(f"color: {COLORS['lime_primary']}; font-size: 8px;")
+        self.status_dot.setStyleSheet(DOT_READY)
         self.show()
         self.raise_()
         
         # Auto-hide after 30 seconds if not used
-        QTimer.singleShot(30000, self.auto_hide)
+        self.hide_timer.start()
+        
+    def get_tts(self) -> TTSEngine:
+        """TTS engine, built on first use (on the GUI thread) to keep startup fast"""
+        if self._tts is None:
+            self._tts = TTSEngine()
+        return self._tts
         
     def hide_pill(self):
         """Hide the pill"""
-        self.status_dot.setStyleSheet(f"color: {COLORS['lime_dim']}; font-size: 8px;")
+        self.hide_timer.stop()
+        self.status_dot.setStyleSheet(DOT_IDLE)
         self.hide()
         
     def auto_hide(self):
         """Auto-hide if not playing"""
-        if not self.tts.is_speaking and not self.is_processing:
+        speaking = self._tts is not None and self._tts.is_speaking
+        if not speaking and not self.is_processing:
             self.hide_pill()
             
     def play_text(self):
@@ -320,12 +357,13 @@ class ReadingPill(QWidget):
         if not self.current_text:
             return
             
-        self.status_dot.setStyleSheet(f"color: #44ff66; font-size: 8px;")  # Green = playing
+        self.status_dot.setStyleSheet(DOT_PLAYING)
+        tts = self.get_tts()
         
         # Auto-punctuate in background then speak
         def process_and_speak():
             text = OllamaClient.auto_punctuate(self.current_text)
-            self.tts.speak(text)
+            tts.speak(text)
             
         thread = threading.Thread(target=process_and_speak)
         thread.daemon = True
@@ -337,17 +375,17 @@ class ReadingPill(QWidget):
             return
             
         self.is_processing = True
-        self.status_dot.setStyleSheet(f"color: #ffaa00; font-size: 8px;")  # Orange = processing
+        self.status_dot.setStyleSheet(DOT_PROCESSING)
         self.summarize_btn.setText("⏳")
+        tts = self.get_tts()
         
         def process_and_speak():
             summary = OllamaClient.summarize(self.current_text)
-            self.tts.speak(f"Summary: {summary}")
+            tts.speak(f"Summary: {summary}")
             self.is_processing = False
             # Reset button
             QTimer.singleShot(0, lambda: self.summarize_btn.setText("📝"))
-            QTimer.singleShot(0, lambda: self.status_dot.setStyleSheet(
-                f"color: #44ff66; font-size: 8px;"))
+            QTimer.singleShot(0, lambda: self.status_dot.setStyleSheet(DOT_PLAYING))
             
         thread = threading.Thread(target=process_and_speak)
         thread.daemon = True
@@ -355,8 +393,9 @@ class ReadingPill(QWidget):
         
     def stop_playback(self):
         """Stop current playback"""
-        self.tts.stop()
-        self.status_dot.setStyleSheet(f"color: {COLORS['lime_primary']}; font-size: 8px;")
+        if self._tts is not None:
+            self._tts.stop()
+        self.status_dot.setStyleSheet(DOT_READY)
         
     def setup_tray(self):
         """Setup system tray icon"""
@@ -115,10 +115,17 @@ class FloaterTray(QSystemTrayIcon):
         from PyQt6.QtCore import QTimer
         QTimer.singleShot(500, lambda: self.on_activated(QSystemTrayIcon.ActivationReason.Trigger))
         
-        # IPC Response Listener - polls for responses from agents
+        # IPC Response Listener - woken by OS change notifications on ipc/
+        # (ReadDirectoryChangesW / inotify via QFileSystemWatcher)
+        from PyQt6.QtCore import QFileSystemWatcher
+        from shared.ipc import IPC_DIR
+        self.ipc_watcher = QFileSystemWatcher([IPC_DIR])
+        self.ipc_watcher.directoryChanged.connect(lambda _path: self.check_ipc_responses())
+        
+        # Slow fallback poll in case a notification is missed
         self.ipc_timer = QTimer()
         self.ipc_timer.timeout.connect(self.check_ipc_responses)
-        self.ipc_timer.start(500)  # Check every 500ms
+        self.ipc_timer.start(5000)
         
     def on_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
@@ -17,8 +17,8 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from PyQt6.QtWidgets import QApplication, QWidget, QMenu
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRectF, QThread
-from PyQt6.QtGui import QPainter, QColor, QRadialGradient, QBrush, QPen, QPixmap, QPainterPath, QAction
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRectF, QThread, QProcess
+from PyQt6.QtGui import QPainter, QColor, QRadialGradient, QBrush, QPen, QPixmap, QPainterPath, QPixmapCache, QAction
 
 logging.basicConfig(
     level=logging.INFO,
@@ -63,10 +63,23 @@ def check_singleton() -> bool:
 def cleanup_lock():
     try:
         if os.path.exists(LOCK_FILE):
+            # Only remove our own lock - after a restart it belongs to the new suite
+            with open(LOCK_FILE, 'r') as f:
+                if f.read().strip() != str(os.getpid()):
+                    return
             os.remove(LOCK_FILE)
     except:
         pass
 
+def restart_suite(app):
+    """Start a fresh suite detached from this one, then quit cleanly."""
+    cleanup_lock()  # Let the new instance pass check_singleton while we shut down
+    args = [os.path.abspath(sys.argv[0])] + sys.argv[1:]
+    if not QProcess.startDetached(sys.executable, args, PROJECT_ROOT)[0]:
+        logger.error("❌ Restart failed to start a new suite")
+        return
+    app.quit()
+
 def cleanup_orphaned_agents():
     """Kill any existing agent processes from previous runs."""
     try:
@@ -142,44 +155,96 @@ class ModuleIcon(QWidget):
         self.fallback_letter = fallback_letter
         self.border_color = border_color
         
+        # Decode the icon once; it is scaled when composited for the screen's
+        # device pixel ratio. A missing file just loads as a null pixmap.
+        pixmap = QPixmap(self.icon_path)
+        self._pixmap = None if pixmap.isNull() else pixmap
+        self._clip_path = QPainterPath()
+        self._clip_path.addEllipse(0.0, 0.0, float(self.size_val), float(self.size_val))
+        
         self._drag_pos = QPoint()
         self._dragging = False
         self._drag_started = False
     
+    @property
+    def border_color(self) -> str:
+        return self._border_color
+    
+    @border_color.setter
+    def border_color(self, color: str):
+        # Rebuild the pen only when the color changes (e.g. voice-it recording state)
+        self._border_color = color
+        self._border_pen = QPen(QColor(color))
+        self._border_pen.setWidth(3)
+        self._composited = None  # Re-composite with the new border on next paint
+    
     def paintEvent(self, event):
+        # Icon, circular mask and border are composited once per device pixel
+        # ratio (re-done if the window moves to a screen with another scale)
+        dpr = self.devicePixelRatioF()
+        if self._composited is None or self._composited.devicePixelRatio() != dpr:
+            if self._pixmap is not None:
+                self._composited = self._render_icon_pixmap(dpr)
+            else:
+                self._composited = self._fallback_pixmap(dpr)
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._composited)
+
+    def _new_canvas(self, dpr: float) -> QPixmap:
+        # Backed by device pixels so the icon stays sharp on HiDPI screens;
+        # painters on it still work in logical (widget) coordinates
+        side = round(self.size_val * dpr)
+        pixmap = QPixmap(side, side)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    def _render_icon_pixmap(self, dpr: float) -> QPixmap:
+        pixmap = self._new_canvas(dpr)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw Icon if exists
-        if os.path.exists(self.icon_path):
-            pixmap = QPixmap(self.icon_path)
-            if not pixmap.isNull():
-                path = QPainterPath()
-                path.addEllipse(0.0, 0.0, float(self.width()), float(self.height()))
-                painter.setClipPath(path)
-                painter.drawPixmap(self.rect(), pixmap)
-                
-                painter.setClipping(False)
-                pen = QPen(QColor(self.border_color))
-                pen.setWidth(3)
-                painter.setBrush(Qt.BrushStyle.NoBrush)
-                painter.setPen(pen)
-                painter.drawEllipse(3, 3, self.width()-6, self.height()-6)
-                return
-
-        # Fallback
-        cx = self.width() / 2.0
-        cy = self.height() / 2.0
-        gradient = QRadialGradient(cx, cy, self.width() / 2.0)
+        side = round(self.size_val * dpr)
+        icon = self._pixmap.scaled(
+            side, side,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        icon.setDevicePixelRatio(dpr)
+        painter.setClipPath(self._clip_path)
+        painter.drawPixmap(0, 0, icon)
+        
+        painter.setClipping(False)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(self._border_pen)
+        painter.drawEllipse(3, 3, self.size_val-6, self.size_val-6)
+        painter.end()
+        return pixmap
+
+    def _fallback_pixmap(self, dpr: float) -> QPixmap:
+        # Shared between icons with the same size/letter/color/scale
+        key = f"hndl-it/module-icon/{self.size_val}/{self.fallback_letter}/{self.border_color}/{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render_fallback_pixmap(dpr)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _render_fallback_pixmap(self, dpr: float) -> QPixmap:
+        pixmap = self._new_canvas(dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        cx = self.size_val / 2.0
+        cy = self.size_val / 2.0
+        gradient = QRadialGradient(cx, cy, self.size_val / 2.0)
         gradient.setColorAt(0, QColor("#1a1a2e"))
         gradient.setColorAt(1, QColor("#0a0a1a"))
         
         painter.setBrush(QBrush(gradient))
-        pen = QPen(QColor(self.border_color))
-        pen.setWidth(3)
-        painter.setPen(pen)
+        painter.setPen(self._border_pen)
         
-        rect = QRectF(3, 3, self.width()-6, self.height()-6)
+        rect = QRectF(3, 3, self.size_val-6, self.size_val-6)
         painter.drawEllipse(rect)
         
         painter.setPen(QColor("#ffffff"))
@@ -188,6 +253,8 @@ class ModuleIcon(QWidget):
         font.setPointSize(18)
         painter.setFont(font)
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.fallback_letter)
+        painter.end()
+        return pixmap
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -216,7 +283,7 @@ def add_context_menu(icon, name, app, hide_callback=None):
             menu.addAction(f"👁️ Hide {name}", hide_callback)
             menu.addSeparator()
 
-        menu.addAction("♻️ Restart Suite", lambda: os.execl(sys.executable, sys.executable, *sys.argv))
+        menu.addAction("♻️ Restart Suite", lambda: restart_suite(app))
         menu.addAction("❌ Close Suite", app.quit)
         menu.exec(icon.mapToGlobal(pos))
     icon.customContextMenuRequested.connect(show)
@@ -3,19 +3,107 @@ Unified Browser LLM MCP Server
 Uses Chrome CDP to access all LLMs via your logged-in browser.
 No API keys needed.
 """
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 import asyncio
-import sys
 import os
+import sys
+
+# hndl-it root and mcp-servers/ come from hndl_it.pth (scripts/install_pth.py)
+try:
+    from agents.browser.browser_controller import BrowserController
+    from llm_registry import LLM_REGISTRY, resolve_llm
+except ImportError:
+    # .pth not installed in this interpreter: add both paths ourselves
+    for _path in (os.path.dirname(os.path.abspath(__file__)),
+                  os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))):
+        if _path not in sys.path:
+            sys.path.insert(0, _path)
+    from agents.browser.browser_controller import BrowserController
+    from llm_registry import LLM_REGISTRY, resolve_llm
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close pooled controllers on shutdown, on the loop that owns their websockets."""
+    try:
+        yield
+    finally:
+        await close_controllers()
+
+
+mcp = FastMCP("browser-llm", lifespan=_lifespan)
+
+# Injected JS, built once at import. Per-call values (selector, prompt) are
+# passed as JSON-encoded arguments via BrowserController.call_function.
+_SET_INPUT_JS = """
+function(selector, text) {
+    const input = window.__hndl.find('input:' + selector, selector);
+    if (input) {
+        input.focus();
+        input.innerText = text;
+        return true;
+    }
+    return false;
+}
+"""
+_SUBMIT_JS = "document.activeElement.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', keyCode: 13, bubbles: true}))"
+
+# One long-lived controller per LLM so repeated prompts reuse the attached
+# CDP session instead of re-launching/re-handshaking on every tool call.
+_BC_POOL: dict[str, BrowserController] = {}
+_BC_LOCKS: dict[str, asyncio.Lock] = {}
+# Tab (CDP target id) each pooled controller opened, closed again on drop
+_BC_TARGETS: dict[str, str] = {}
 
-# Add hndl-it to path
-HNDL_IT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, HNDL_IT_PATH)
 
-from agents.browser.browser_controller import BrowserController
-from mcp_servers.llm_registry import LLM_REGISTRY
+def _llm_lock(llm: str) -> asyncio.Lock:
+    """Per-LLM lock; hold it for the whole navigate/type/submit/scrape sequence."""
+    return _BC_LOCKS.setdefault(llm, asyncio.Lock())
 
-mcp = FastMCP("browser-llm")
+
+async def get_controller(llm: str) -> BrowserController:
+    """Return the pooled controller for `llm`, starting it on first use.
+
+    Caller must hold _llm_lock(llm) so no other call drives or drops the
+    controller while it is in use.
+    """
+    bc = _BC_POOL.get(llm)
+    if bc is None or bc.websocket is None:
+        bc = BrowserController()
+        await bc.start()
+        # Give each LLM its own tab (Target.createTarget) so they can run side by side
+        target_id = await bc.open_new_tab()
+        _BC_POOL[llm] = bc
+        if target_id:
+            _BC_TARGETS[llm] = target_id
+    return bc
+
+
+async def _drop_controller(llm: str):
+    """Forget a controller whose connection went bad so the next call reconnects.
+
+    Caller must hold _llm_lock(llm).
+    """
+    bc = _BC_POOL.pop(llm, None)
+    target_id = _BC_TARGETS.pop(llm, None)
+    if bc is not None:
+        if target_id:
+            try:
+                await bc.close_tab(target_id)
+            except Exception:
+                pass
+        try:
+            await bc.close()
+        except Exception:
+            pass
+
+
+async def close_controllers():
+    """Close every pooled controller, waiting for in-flight calls to finish."""
+    for llm in list(_BC_POOL):
+        async with _llm_lock(llm):
+            await _drop_controller(llm)
 
 
 @mcp.tool()
@@ -30,50 +118,73 @@ async def ask_llm(llm: str, prompt: str) -> str:
     Returns:
         The LLM's response text
     """
+    return await _ask(llm, prompt)
+
+
+@mcp.tool()
+async def ask_llms(llms: list[str], prompt: str, max_parallel: int = 4) -> dict:
+    """
+    Send the same prompt to several LLMs at once, each in its own tab.
+    
+    Args:
+        llms: LLM names, e.g. ["gemini", "claude", "chatgpt"]
+        prompt: The message to send
+        max_parallel: Upper bound on concurrently driven tabs
+    
+    Returns:
+        Mapping of LLM name to response text (or error string)
+    """
+    names = list(dict.fromkeys(llm.lower() for llm in llms))
+    sem = asyncio.Semaphore(max(1, max_parallel))
+
+    async def bounded(llm: str) -> str:
+        async with sem:
+            return await _ask(llm, prompt)
+
+    results = await asyncio.gather(*(bounded(llm) for llm in names), return_exceptions=True)
+    return {
+        llm: (f"Error: {res}" if isinstance(res, BaseException) else res)
+        for llm, res in zip(names, results)
+    }
+
+
+async def _ask(llm: str, prompt: str) -> str:
     llm = llm.lower()
-    if llm not in LLM_REGISTRY:
+    config = resolve_llm(llm)
+    if config is None:
         return f"Unknown LLM: {llm}. Available: {list(LLM_REGISTRY.keys())}"
     
-    config = LLM_REGISTRY[llm]
-    bc = BrowserController()
-    
+    async with _llm_lock(llm):
+        return await _ask_locked(llm, config, prompt)
+
+
+async def _ask_locked(llm: str, config: dict, prompt: str) -> str:
     try:
-        await bc.start()
+        bc = await get_controller(llm)
         await bc.navigate(config["url"])
         
         # Wait for input to be ready
-        await asyncio.sleep(2)
+        if not await bc.wait_for_selector(config["input_selector"], timeout=10):
+            return f"Could not find input field for {llm}"
         
         # Type the prompt
-        script = f"""
-        (function() {{
-            const input = document.querySelector('{config["input_selector"]}');
-            if (input) {{
-                input.focus();
-                input.innerText = `{prompt.replace('`', '\\`')}`;
-                return true;
-            }}
-            return false;
-        }})()
-        """
-        success = await bc.execute_script(script)
+        success = await bc.call_function(_SET_INPUT_JS, config["input_selector"], prompt)
         if not success:
             return f"Could not find input field for {llm}"
         
         # Submit
-        await bc.execute_script("document.activeElement.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', keyCode: 13, bubbles: true}))")
+        await bc.execute_script(_SUBMIT_JS)
         
-        # Wait for response
-        await asyncio.sleep(5)
+        # Wait for the response to finish streaming
+        await bc.wait_for_stable(config.get("response_selector"), quiet_ms=800)
         
         # Scrape response
         response = await bc.scrape_text(config.get("response_selector"))
         return response or "No response captured"
         
     except Exception as e:
+        await _drop_controller(llm)
         return f"Error: {e}"
-    finally:
-        await bc.close()
 
 
 @mcp.tool()
@@ -86,16 +197,18 @@ async def list_llms() -> str:
 async def open_llm(llm: str) -> str:
     """Open an LLM in the browser without sending a prompt."""
     llm = llm.lower()
-    if llm not in LLM_REGISTRY:
+    config = resolve_llm(llm)
+    if config is None:
         return f"Unknown LLM: {llm}"
     
-    bc = BrowserController()
-    try:
-        await bc.start()
-        await bc.navigate(LLM_REGISTRY[llm]["url"])
-        return f"Opened {llm}"
-    except Exception as e:
-        return f"Error: {e}"
+    async with _llm_lock(llm):
+        try:
+            bc = await get_controller(llm)
+            await bc.navigate(config["url"])
+            return f"Opened {llm}"
+        except Exception as e:
+            await _drop_controller(llm)
+            return f"Error: {e}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+# Chrome CDP attach helper
+# Lets Playwright-based servers attach to one always-on Chrome over CDP
+# instead of launching a persistent context (and a new Chrome) per call.
+# The debug Chrome runs on its own profile and port, separate from the user's
+# everyday Chrome (default User Data) and from BrowserController's 9222, so it
+# can run alongside both. Sign in to the sites once in that window.
+
+import os
+import socket
+import subprocess
+import time
+
+CDP_HOST = "localhost"
+CDP_PORT = 9223
+CDP_URL = f"http://{CDP_HOST}:{CDP_PORT}"
+
+# Dedicated profile for the debug Chrome (hndl-it root, next to chrome_profile/)
+DEBUG_PROFILE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "chrome_profile_cdp")
+)
+
+CHROME_CANDIDATES = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
+]
+
+
+def is_debug_port_open(timeout: float = 0.5) -> bool:
+    """True if something is listening on the CDP port."""
+    try:
+        with socket.create_connection((CDP_HOST, CDP_PORT), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def ensure_chrome_debug(user_data_dir: str = DEBUG_PROFILE_DIR, wait: float = 10) -> bool:
+    """
+    Make sure a Chrome with --remote-debugging-port is running.
+    Launches one (detached) only if nothing is listening yet.
+    """
+    if is_debug_port_open():
+        return True
+
+    chrome_path = next((p for p in CHROME_CANDIDATES if os.path.exists(p)), None)
+    if not chrome_path:
+        print("Could not find chrome.exe in standard locations.")
+        return False
+
+    os.makedirs(user_data_dir, exist_ok=True)
+
+    subprocess.Popen([
+        chrome_path,
+        f"--remote-debugging-port={CDP_PORT}",
+        f"--user-data-dir={user_data_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ], close_fds=True)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_debug_port_open():
+            return True
+        time.sleep(0.25)
+    return False
@@ -1,13 +1,30 @@
 from fastmcp import FastMCP
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import os
+import sys
 import time
 
+# mcp-servers/ comes from hndl_it.pth (see scripts/install_pth.py)
+try:
+    from chrome_debug import CDP_URL, DEBUG_PROFILE_DIR, ensure_chrome_debug
+except ImportError:
+    # .pth not installed in this interpreter: add mcp-servers/ ourselves
+    _MCP_SERVERS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if _MCP_SERVERS_PATH not in sys.path:
+        sys.path.append(_MCP_SERVERS_PATH)
+    from chrome_debug import CDP_URL, DEBUG_PROFILE_DIR, ensure_chrome_debug
+
 mcp = FastMCP("claude-web")
 
 # Config
-USER_DATA_DIR = r"C:\Users\dell3630\AppData\Local\Google\Chrome\User Data"
-HEADLESS = False  # Set to False so you can see it working initially
+USER_DATA_DIR = DEBUG_PROFILE_DIR
+RESPONSE_SELECTOR = ".prose"
+STREAMING_SELECTOR = "[data-is-streaming='true']"
+RESPONSE_TIMEOUT_MS = 120_000
+
+# Done when a response exists and nothing is marked as streaming any more
+_RESPONSE_DONE_JS = f"""() => !document.querySelector("{STREAMING_SELECTOR}")
+    && !!document.querySelector("{RESPONSE_SELECTOR}")"""
 
 @mcp.tool()
 def ask_claude_web(prompt: str, context_files: list[str] = None) -> str:
@@ -15,40 +32,45 @@ def ask_claude_web(prompt: str, context_files: list[str] = None) -> str:
     Ask Claude.ai a question using the user's existing logic/browser session.
     No API key required. Uses web automation.
     """
+    if not ensure_chrome_debug(USER_DATA_DIR):
+        return f"Chrome is not reachable at {CDP_URL}"
+    
     with sync_playwright() as p:
-        # Connect to browser with user profile (requires closing main Chrome first usually, 
-        # or we use a separate profile/debugging port)
-        browser = p.chromium.launch_persistent_context(
-            user_data_dir=USER_DATA_DIR,
-            channel="chrome",
-            headless=HEADLESS,
-            args=["--remote-debugging-port=9222"] 
-        )
-        
-        page = browser.new_page()
-        page.goto("https://claude.ai/new")
+        # Attach to the long-lived debug Chrome instead of launching one per call
+        browser = p.chromium.connect_over_cdp(CDP_URL)
+        context = browser.contexts[0] if browser.contexts else browser.new_context()
         
-        # Wait for input box
-        # Note: Selectors change, this is a best-guess stable selector strategy
-        page.wait_for_selector("div[contenteditable='true']")
-        
-        # Attach files if needed (stub)
-        if context_files:
-            pass 
+        page = context.new_page()
+        try:
+            page.goto("https://claude.ai/new")
+
+            # Wait for input box
+            # Note: Selectors change, this is a best-guess stable selector strategy
+            page.wait_for_selector("div[contenteditable='true']")
+
+            # Attach files if needed (stub)
+            if context_files:
+                pass 
+
+            # Type prompt
+            page.fill("div[contenteditable='true']", prompt)
+            page.keyboard.press("Enter")
+
+            # Wait for the response to finish streaming
+            try:
+                page.wait_for_function(_RESPONSE_DONE_JS, timeout=RESPONSE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                pass  # Return whatever has streamed so far
+
+            # Scrape last message
+            response = page.eval_on_selector_all(
+                RESPONSE_SELECTOR, "els => els.length ? els[els.length - 1].innerText : ''"
+            )
+            return response or "Command sent to Claude.ai (no response captured)"
+        finally:
+            # Attached over CDP: closing the browser would not close our tab
+            page.close()
 
-        # Type prompt
-        page.fill("div[contenteditable='true']", prompt)
-        page.keyboard.press("Enter")
-        
-        # Wait for response (look for "Copy" button or cessation of streaming)
-        # This is the tricky part in web auto - simplified wait here
-        page.wait_for_timeout(5000) 
-        
-        # Scrape last message
-        # Adding simple scraping logic here
-        
-        # browser.close() # Keep open?
-        return "Command sent to Claude.ai (Web Automation)"
 
 if __name__ == "__main__":
     mcp.run()
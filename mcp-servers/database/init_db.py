@@ -4,10 +4,18 @@ import os
 db_path = r"c:/IIWII_DB/hndl-it/mcp-servers/database/main.db"
 os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
+# Seed rows as (id, content); fixed ids keep re-runs from duplicating them
+SEED_NOTES = [
+    (1, "Welcome to your MCP Database"),
+]
+
 conn = sqlite3.connect(db_path)
-c = conn.cursor()
-c.execute('CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY, content TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)')
-c.execute("INSERT INTO notes (content) VALUES ('Welcome to your MCP Database')")
-conn.commit()
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+
+# One transaction for schema + seed (commits on success, rolls back on error)
+with conn:
+    conn.execute('CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY, content TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)')
+    conn.executemany("INSERT OR IGNORE INTO notes (id, content) VALUES (?, ?)", SEED_NOTES)
 conn.close()
 print("Database created successfully.")
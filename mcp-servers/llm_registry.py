@@ -1,7 +1,10 @@
 # LLM Browser MCP Registry
 # All LLMs accessible via Chrome CDP (no API fees)
 
-LLM_REGISTRY = {
+from types import MappingProxyType
+from typing import Optional
+
+_RAW = {
     "gemini": {
         "url": "https://gemini.google.com/app",
         "input_selector": "div[contenteditable='true']",
@@ -52,3 +55,15 @@ LLM_REGISTRY = {
         "profile": "brihag8"
     }
 }
+
+# Read-only view so tools can share it safely; keys are already lowercase.
+LLM_REGISTRY = MappingProxyType(_RAW)
+
+# Case-folded name -> canonical key, computed once at import.
+_ALIASES = {k.casefold(): k for k in LLM_REGISTRY}
+
+
+def resolve_llm(name: str) -> Optional[dict]:
+    """Return the config for `name` (case-insensitive), or None if unknown."""
+    key = _ALIASES.get(name.casefold())
+    return LLM_REGISTRY[key] if key is not None else None
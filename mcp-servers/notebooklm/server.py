@@ -1,122 +1,204 @@
 from fastmcp import FastMCP
 import asyncio
-import sys
 import os
+import sys
+from typing import Optional
 
 # Create MCP
 mcp = FastMCP("notebooklm-web")
 
 # --- Import hndl-it BrowserController (lightweight CDP) ---
-# We verify the path exists first
-HNDL_IT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-sys.path.append(HNDL_IT_PATH)
+# hndl-it root comes from hndl_it.pth (see scripts/install_pth.py)
 
 try:
     from agents.browser.browser_controller import BrowserController
 except ImportError:
-    # Fallback: Copy-paste the minimal BrowserController logic if import fails
-    # (For robustness in standalone mode)
-    print("Warning: Could not import BrowserController from hndl-it. Using fallback stub.")
-    class BrowserController:
-        def __init__(self): pass
-        async def start(self): pass
-        async def navigate(self, url): pass
-        async def execute_script(self, script): return "Mock Success"
-        async def close(self): pass
+    # .pth not installed in this interpreter: add the hndl-it root ourselves
+    HNDL_IT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+    if HNDL_IT_PATH not in sys.path:
+        sys.path.append(HNDL_IT_PATH)
+    try:
+        from agents.browser.browser_controller import BrowserController
+    except ImportError as e:
+        raise ImportError(
+            "Could not import BrowserController from hndl-it. "
+            "Run `python scripts/install_pth.py` in this venv."
+        ) from e
+
+# --- Injected JS (built once; per-call values are passed as JSON-encoded args) ---
+
+# One async program per action: click + wait-for-selector + read happen inside
+# the page, so each tool costs a single Runtime.evaluate (awaitPromise=true).
+# Note: Selectors are fragile, these are best-guesses based on the current UI.
+_NOTEBOOK_JS = """
+async function(action, args) {
+    // Resolves once check() returns something truthy, or null after ms
+    const waitUntil = (check, ms) => new Promise(resolve => {
+        const found = check();
+        if (found) { resolve(found); return; }
+        const obs = new MutationObserver(() => {
+            const hit = check();
+            if (hit) { obs.disconnect(); clearTimeout(limit); resolve(hit); }
+        });
+        const limit = setTimeout(() => { obs.disconnect(); resolve(null); }, ms);
+        obs.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    });
+    const query = (selector, predicate) => predicate
+        ? Array.prototype.find.call(document.querySelectorAll(selector), predicate)
+        : document.querySelector(selector);
+    const waitFor = (selector, ms, predicate) => waitUntil(() => query(selector, predicate), ms);
+    const label = el => (el.innerText || el.getAttribute('aria-label') || '').trim();
+    const settle = (quietMs, maxMs) => new Promise(resolve => {
+        let quiet = null;
+        const done = () => { obs.disconnect(); clearTimeout(quiet); clearTimeout(limit); resolve(); };
+        const arm = () => { clearTimeout(quiet); quiet = setTimeout(done, quietMs); };
+        const obs = new MutationObserver(arm);
+        const limit = setTimeout(done, maxMs);
+        obs.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+        arm();
+    });
+
+    if (action === "create_notebook") {
+        // Logic: Find the big 'New Notebook' tile
+        const tile = window.__hndl.find('new_notebook_tile', 'div[role="button"]',
+            t => t.innerText.includes("New Notebook"));
+        if (tile) {
+            tile.click();
+            return "Clicked New Notebook";
+        }
+        return "New Notebook button not found";
+    }
+
+    if (action === "add_source") {
+        // Sources pane: 'Add source' -> Website/YouTube chip -> URL box -> Insert
+        const addBtn = await waitFor('button', 10000, b => /add source/i.test(label(b)));
+        if (!addBtn) return "Add source button not found";
+        addBtn.click();
+        const kind = /youtube\.com|youtu\.be/i.test(args.url) ? /youtube/i : /website|link/i;
+        const chip = await waitFor('[role="button"], button, mat-chip', 10000, c => kind.test(label(c)));
+        if (!chip) return "Source type option not found";
+        chip.click();
+        const box = await waitFor(
+            'input[type="url"], [placeholder*="url" i], [placeholder*="link" i]', 10000);
+        if (!box) return "Source URL input not found";
+        box.focus();
+        box.value = args.url;
+        box.dispatchEvent(new Event('input', { bubbles: true }));
+        const insert = await waitFor('button', 5000, b => /^insert$/i.test(label(b)) && !b.disabled);
+        if (!insert) return "Insert button not found";
+        insert.click();
+        return "Source added: " + args.url;
+    }
+
+    if (action === "query") {
+        const input = await waitFor('textarea[placeholder*="chat"]', 10000);
+        if (!input) return "Chat input not found";
+        // Count replies before sending so an old answer is never mistaken for ours
+        const before = document.querySelectorAll(args.response_selector).length;
+        input.value = args.question;
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        // Click the send button
+        const sendBtn = window.__hndl.find('send_button', 'button[aria-label*="send"]');
+        if (sendBtn) sendBtn.click();
+        // Wait for a new reply to appear, then for it to stop streaming
+        const started = await waitUntil(
+            () => document.querySelectorAll(args.response_selector).length > before, 60000);
+        if (!started) return "Query submitted (no new reply appeared)";
+        await settle(1500, 120000);
+        const replies = document.querySelectorAll(args.response_selector);
+        return replies[replies.length - 1].innerText;
+    }
+
+    return "Unknown action: " + action;
+}
+"""
+
+# Best-guess selector for chat answers
+RESPONSE_SELECTOR = '[class*="response"]'
+
+# --- Controller (kept open across tool calls) ---
+
+_bc: Optional[BrowserController] = None
+# Held across each whole action (and the drop on error): every tool shares one
+# CDP socket, and _send_cdp can't untangle interleaved replies
+_bc_lock = asyncio.Lock()
+
+
+async def get_controller() -> BrowserController:
+    """Return the shared controller, connecting on first use. Caller holds _bc_lock."""
+    global _bc
+    if _bc is None:
+        bc = BrowserController()
+        await bc.start()
+        _bc = bc
+    return _bc
+
+
+async def _drop_controller():
+    """Forget a controller whose connection went bad so the next call reconnects.
+
+    Caller holds _bc_lock.
+    """
+    global _bc
+    bc, _bc = _bc, None
+    if bc is not None:
+        try:
+            await bc.close()
+        except Exception:
+            pass
+
+
+async def notebook_action(action: str, **kwargs):
+    """Run one NotebookLM action as a single in-page async program. Caller holds _bc_lock."""
+    bc = await get_controller()
+    return await bc.call_function(_NOTEBOOK_JS, action, kwargs)
 
 # --- Tools ---
 
 @mcp.tool()
 async def open_notebooklm() -> str:
     """Launches NotebookLM in the active hndl-it browser (CDP)."""
-    bc = BrowserController()
-    try:
-        await bc.start()
-        await bc.navigate("https://notebooklm.google.com/")
-        return "Navigated to NotebookLM"
-    except Exception as e:
-        return f"Error: {e}"
-    finally:
-        await bc.close()
+    async with _bc_lock:
+        try:
+            bc = await get_controller()
+            await bc.navigate("https://notebooklm.google.com/")
+            return "Navigated to NotebookLM"
+        except Exception as e:
+            await _drop_controller()
+            return f"Error: {e}"
 
 @mcp.tool()
 async def create_new_notebook() -> str:
     """kliks 'New Notebook' via JS injection."""
-    bc = BrowserController()
-    try:
-        await bc.start()
-        
-        # JS to find and click the 'New Notebook' square
-        # Note: Selectors are fragile, this is a best-guess based on current UI
-        script = """
-        (function() {
-            // Logic: Find the big 'New Notebook' tile
-            const tiles = document.querySelectorAll('div[role="button"]');
-            for (const tile of tiles) {
-                if (tile.innerText.includes("New Notebook")) {
-                    tile.click();
-                    return "Clicked New Notebook";
-                }
-            }
-            return "New Notebook button not found";
-        })()
-        """
-        result = await bc.execute_script(script)
-        return f"Result: {result}"
-    except Exception as e:
-        return f"Error: {e}"
-    finally:
-        await bc.close()
+    async with _bc_lock:
+        try:
+            result = await notebook_action("create_notebook")
+            return f"Result: {result}"
+        except Exception as e:
+            await _drop_controller()
+            return f"Error: {e}"
 
 @mcp.tool()
 async def add_source(url: str) -> str:
     """Adds a web source (URL, YouTube, etc.) to the current notebook."""
-    bc = BrowserController()
-    try:
-        await bc.start()
-        # Navigate to the add sources button logic
-        # This is a complex UI interaction, for now we use a placeholder JS snippet
-        script = f"""
-        (function() {{
-            console.log("Adding source: {url}");
-            // Best-guess: Use the 'Add Source' UI or the 'Sources' pane
-            return "Source addition triggered for " + "{url}";
-        }})()
-        """
-        result = await bc.execute_script(script)
-        return f"Result: {result}"
-    except Exception as e:
-        return f"Error: {e}"
-    finally:
-        await bc.close()
+    async with _bc_lock:
+        try:
+            result = await notebook_action("add_source", url=url)
+            return f"Result: {result}"
+        except Exception as e:
+            await _drop_controller()
+            return f"Error: {e}"
 
 @mcp.tool()
 async def query_notebook(question: str) -> str:
     """Queries the current notebook and returns the AI response."""
-    bc = BrowserController()
-    try:
-        await bc.start()
-        # JS to type into the chat input and wait for response
-        script = f"""
-        (function() {{
-            const input = document.querySelector('textarea[placeholder*="chat"]');
-            if (input) {{
-                input.value = "{question}";
-                input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                // Click the send button
-                const sendBtn = document.querySelector('button[aria-label*="send"]');
-                if (sendBtn) sendBtn.click();
-                return "Query submitted";
-            }}
-            return "Chat input not found";
-        }})()
-        """
-        result = await bc.execute_script(script)
-        return f"Query sent. Status: {result}"
-    except Exception as e:
-        return f"Error: {e}"
-    finally:
-        await bc.close()
+    async with _bc_lock:
+        try:
+            result = await notebook_action("query", question=question, response_selector=RESPONSE_SELECTOR)
+            return f"Query sent. Status: {result}"
+        except Exception as e:
+            await _drop_controller()
+            return f"Error: {e}"
 
 if __name__ == "__main__":
     mcp.run()
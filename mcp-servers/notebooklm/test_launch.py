@@ -1,30 +1,39 @@
 from playwright.sync_api import sync_playwright
 import os
+import sys
 import time
 
-USER_DATA_DIR = r"C:\Users\dell3630\AppData\Local\Google\Chrome\User Data"
+# mcp-servers/ comes from hndl_it.pth (see scripts/install_pth.py)
+try:
+    from chrome_debug import CDP_URL, DEBUG_PROFILE_DIR, ensure_chrome_debug
+except ImportError:
+    # .pth not installed in this interpreter: add mcp-servers/ ourselves
+    _MCP_SERVERS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if _MCP_SERVERS_PATH not in sys.path:
+        sys.path.append(_MCP_SERVERS_PATH)
+    from chrome_debug import CDP_URL, DEBUG_PROFILE_DIR, ensure_chrome_debug
+
+USER_DATA_DIR = DEBUG_PROFILE_DIR
 
 def test_launch():
     print(f"Attempting to launch Chrome with profile: {USER_DATA_DIR}")
     if os.path.exists(USER_DATA_DIR):
         print("Profile directory found.")
     else:
-        print("Profile directory NOT found!")
-        return
+        print("Profile directory not found; it will be created (sign in once).")
 
     try:
+        if not ensure_chrome_debug(USER_DATA_DIR):
+            print(f"CRITICAL ERROR: Chrome is not reachable at {CDP_URL}")
+            return
+
         with sync_playwright() as p:
-            # Note: This might fail if Chrome is already open
-            print("Launching browser context...")
-            browser = p.chromium.launch_persistent_context(
-                user_data_dir=USER_DATA_DIR,
-                channel="chrome",
-                headless=False,
-                args=["--remote-debugging-port=9222"] 
-            )
-            print("Browser launched!")
+            print(f"Attaching to Chrome at {CDP_URL}...")
+            browser = p.chromium.connect_over_cdp(CDP_URL)
+            context = browser.contexts[0] if browser.contexts else browser.new_context()
+            print("Browser attached!")
             
-            page = browser.new_page()
+            page = context.new_page()
             print("Navigating to NotebookLM...")
             page.goto("https://notebooklm.google.com/")
             
@@ -41,14 +50,14 @@ def test_launch():
             else:
                 print("STATUS: Likely logged in.")
 
-            print("Closing in 5 seconds...")
+            print("Closing test tab in 5 seconds...")
             time.sleep(5)
-            browser.close()
+            page.close()
             print("Test complete.")
             
     except Exception as e:
         print(f"CRITICAL ERROR: {e}")
-        print("hint: Make sure all Chrome windows are CLOSED before helping.")
+        print(f"hint: Make sure Chrome is running with --remote-debugging-port (see {CDP_URL}).")
 
 if __name__ == "__main__":
     test_launch()
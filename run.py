@@ -5,28 +5,62 @@ import os
 import signal
 import argparse
 import tempfile
+import socket
+import atexit
 # fcntl only on Unix
 
+# Working directory for every spawned service
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Windows mutex for singleton
 LOCK_FILE = os.path.join(tempfile.gettempdir(), "hndl-it.lock")
 
+# Max time to wait for an agent server to start listening
+AGENT_START_TIMEOUT = 10.0
+
+# Held for the life of the process; releasing it (GC/close) frees the singleton
+_LOCK_HANDLE = None
+
 def is_already_running():
     """Check if another instance is already running"""
+    global _LOCK_HANDLE
     if sys.platform == 'win32':
         import ctypes
         kernel32 = ctypes.windll.kernel32
         mutex = kernel32.CreateMutexW(None, False, "hndl-it-singleton-mutex")
         if kernel32.GetLastError() == 183:  # ERROR_ALREADY_EXISTS
             return True
+        _LOCK_HANDLE = mutex  # Closed by Windows when the process exits
         return False
     else:
         # Unix: use file lock
+        import fcntl
         try:
             lock_fd = open(LOCK_FILE, 'w')
             fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            return False
-        except:
+        except OSError:
+            return True
+        _LOCK_HANDLE = lock_fd
+        atexit.register(lock_fd.close)
+        return False
+
+def wait_port(port, process=None, timeout=AGENT_START_TIMEOUT):
+    """Wait until something accepts connections on localhost:port.
+
+    Returns False on timeout, or as soon as `process` exits.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            # "localhost" like the agents bind, so IPv4 and IPv6 are both tried
+            socket.create_connection(("localhost", port), timeout=0.5).close()
             return True
+        except OSError:
+            pass
+        if process is not None and process.poll() is not None:
+            return False
+        time.sleep(0.05)
+    return False
 
 def main():
     # Singleton check
@@ -43,42 +77,33 @@ def main():
     processes = []
     
     try:
-        # 1. Start Browser Agent
-        print("Starting Browser Agent (Port 8766)...")
-        browser_process = subprocess.Popen(
-            [sys.executable, "agents/browser/server.py"],
-            cwd=os.path.dirname(os.path.abspath(__file__)),
-            shell=False
-        )
-        processes.append(browser_process)
-        time.sleep(2) # Wait for server to start
-        
-        # 2. Start Desktop Agent (Files)
-        print("Starting Desktop Agent (Port 8767)...")
-        desktop_process = subprocess.Popen(
-            [sys.executable, "agents/desktop/server.py"],
-            cwd=os.path.dirname(os.path.abspath(__file__)),
-            shell=False
-        )
-        processes.append(desktop_process)
-        time.sleep(1)
-
-        # 3. Start Vision Agent (Optional)
+        # 1-3. Start the agents together so their startup overlaps
+        agents = [("Browser Agent", "agents/browser/server.py", 8766),
+                  ("Desktop Agent", "agents/desktop/server.py", 8767)]  # Desktop = Files
         if args.with_vision:
-            print("Starting Vision Agent (Port 8768)...")
-            vision_process = subprocess.Popen(
-                [sys.executable, "agents/vision/server.py"],
-                cwd=os.path.dirname(os.path.abspath(__file__)),
+            agents.append(("Vision Agent", "agents/vision/server.py", 8768))  # Optional
+
+        started = []
+        for name, script, port in agents:
+            print(f"Starting {name} (Port {port})...")
+            process = subprocess.Popen(
+                [sys.executable, script],
+                cwd=_BASE_DIR,
                 shell=False
             )
-            processes.append(vision_process)
-            time.sleep(1)
+            processes.append(process)
+            started.append((name, process, port))
+
+        # Wait until each server is actually listening instead of sleeping blindly
+        for name, process, port in started:
+            if not wait_port(port, process):
+                print(f"⚠️ {name} is not listening on port {port}, continuing anyway")
 
         # 4. Start Floater UI
         print("Starting Floater UI...")
         floater_process = subprocess.Popen(
             [sys.executable, "floater/main.py"],
-            cwd=os.path.dirname(os.path.abspath(__file__)),
+            cwd=_BASE_DIR,
             shell=False
         )
         processes.append(floater_process)
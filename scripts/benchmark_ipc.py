@@ -2,6 +2,7 @@ import sys
 import os
 import time
 import threading
+import array
 import json
 import statistics
 from datetime import datetime
@@ -17,17 +18,18 @@ if not os.path.exists(IPC_DIR):
     os.makedirs(IPC_DIR, exist_ok=True)
 
 class BenchmarkAgent(BaseAgent):
-    def __init__(self):
+    def __init__(self, capacity: int = 1024):
         super().__init__("benchmark", poll_interval=0.5, max_workers=1)
-        self.received_times = []
+        # Latency per message seq, preallocated so the hot path doesn't allocate
+        self.received_times = array.array('d', [0.0]) * capacity
         self.message_event = threading.Event()
 
     def process_action(self, action: str, payload: dict):
         if action == "test":
-            recv_time = time.time()
-            send_time = payload.get("send_time")
-            latency = recv_time - send_time
-            self.received_times.append(latency)
+            # Sender and agent share this process, so perf_counter is comparable
+            # (time.time() only ticks every ~15 ms on Windows)
+            latency = time.perf_counter() - payload["send_time"]
+            self.received_times[payload["seq"]] = latency
             self.message_event.set()
 
 def run_benchmark():
@@ -47,14 +49,13 @@ def run_benchmark():
     try:
         for i in range(iterations):
             agent.message_event.clear()
-            send_time = time.time()
 
             # Send command
-            send_command("benchmark", "test", {"send_time": send_time})
+            send_command("benchmark", "test", {"seq": i, "send_time": time.perf_counter()})
 
             # Wait for processing
             if agent.message_event.wait(timeout=2.0):
-                latency = agent.received_times[-1]
+                latency = agent.received_times[i]
                 latencies.append(latency)
                 print(f"  Iteration {i+1}: {latency*1000:.2f} ms")
             else:
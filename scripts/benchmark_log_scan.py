@@ -7,10 +7,12 @@ def generate_large_log(filepath, size_mb=50):
     """Generates a log file of approximately size_mb MB."""
     print(f"Generating {size_mb}MB log file at {filepath}...")
     start_gen = time.time()
-    with open(filepath, 'w', encoding='utf-8') as f:
+    # Encode once and write bytes: no per-write encoding through TextIOWrapper
+    # (writes larger than the buffer go straight to the OS)
+    with open(filepath, 'wb') as f:
         # standard line approx 100 bytes
         line = "2023-10-27 10:00:00 - systems_engineer - INFO - This is a standard log line that takes up some space to simulate a real log file content.\n"
-        chunk = line * 1000 # ~100KB
+        chunk = (line * 1000).encode('utf-8') # ~100KB
         target_size = size_mb * 1024 * 1024
         current_size = 0
         while current_size < target_size:
@@ -18,8 +20,9 @@ def generate_large_log(filepath, size_mb=50):
             current_size += len(chunk)
 
         # Add some errors at the end
-        for i in range(10):
-            f.write(f"2023-10-27 10:05:00 - systems_engineer - ERROR - Critical failure {i}\n")
+        f.write("".join(
+            f"2023-10-27 10:05:00 - systems_engineer - ERROR - Critical failure {i}\n" for i in range(10)
+        ).encode('utf-8'))
     print(f"Generation took {time.time() - start_gen:.2f}s")
 
 def original_read_last_lines(filepath, n=50):
@@ -60,6 +63,7 @@ def optimized_read_last_lines(filepath, n=50):
         file_end = f.tell()
         current_pos = file_end
         blocks = []
+        nl_count = 0  # Running total, so blocks are only joined once at the end
 
         while current_pos > 0 and len(blocks) * (block_size / 100) < n * 2: # Rough heuristic, check line count later
             step = min(block_size, current_pos)
@@ -68,19 +72,11 @@ def optimized_read_last_lines(filepath, n=50):
             chunk = f.read(step)
             blocks.append(chunk)
 
-            # Quick check if we have enough newlines
-            # This is an optimization to avoid reading too much
-            # Join reversed blocks to check
-            # (But careful with multibyte chars split across blocks, though utf-8 self-synchronizes mostly)
-
-            # Simple approach: Read enough blocks until we are sure we have N lines
-            # Count newlines in current chunk
-            if chunk.count(b'\n') >= n:
-                 break
-
-            # If we collected a lot of data, maybe check properly
-            total_data = b"".join(reversed(blocks))
-            if total_data.count(b'\n') >= n:
+            # n + 1 newlines guarantee the first of the last n lines is complete
+            # (utf-8 self-synchronizes, so a split multibyte char only affects the
+            # discarded partial line)
+            nl_count += chunk.count(b'\n')
+            if nl_count >= n + 1:
                 break
 
         # Process the collected bytes
@@ -12,6 +12,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     import ollama
 except ImportError:
+    # Keep the mock's simulated network latency for a meaningful benchmark
+    os.environ.setdefault("MOCK_OLLAMA_LATENCY", "0.1")
     import scripts.mock_ollama_setup
 
 from shared.orchestrator import get_orchestrator
@@ -19,6 +21,9 @@ from shared.orchestrator import get_orchestrator
 # Configure logging
 logging.basicConfig(level=logging.ERROR)
 
+# Commands in flight at once (worker coroutines); the old gather ran all 25 at once
+MAX_CONCURRENCY = 8
+
 async def benchmark_async():
     orchestrator = get_orchestrator()
 
@@ -37,9 +42,21 @@ async def benchmark_async():
     # Check if process is async
     if asyncio.iscoroutinefunction(orchestrator.process):
         print("Detected Async Orchestrator")
-        # Run concurrently
-        tasks = [orchestrator.process(cmd) for cmd in commands]
-        await asyncio.gather(*tasks)
+        # A fixed pool of MAX_CONCURRENCY workers pulls from one shared iterator,
+        # so only that many coroutines ever exist, however long the command list
+        pending = iter(commands)
+        done = 0
+
+        async def worker():
+            nonlocal done
+            for cmd in pending:
+                await orchestrator.process(cmd)
+                # Report progress as results land instead of waiting for the whole batch
+                done += 1
+                print(f"\r  {done}/{len(commands)} done", end="", flush=True)
+
+        await asyncio.gather(*(worker() for _ in range(min(MAX_CONCURRENCY, len(commands)))))
+        print()
     else:
         print("Detected Sync Orchestrator")
         for cmd in commands:
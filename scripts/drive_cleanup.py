@@ -3,12 +3,23 @@ hndl-it Drive Cleanup & Archive Utility
 Handles: Temp cleanup, deduplication, archive structuring
 """
 import os
+import stat
+import ctypes
 import hashlib
 import shutil
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# xxHash3 is much faster than MD5; dedup fingerprints don't need a crypto hash
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 # Config
 C_DRIVE_TARGETS = [
@@ -19,87 +30,285 @@ C_DRIVE_TARGETS = [
 
 ARCHIVE_ROOT = Path(r"D:\Archives")
 DEDUP_MIN_SIZE_MB = 1  # Only dedup files > 1MB
+DEDUP_SKIP_DIRS = {"node_modules", ".git", "__pycache__", "venv", ".venv", "AppData"}
+DEDUP_SKIP_EXTS = {".tmp", ".crdownload", ".part"}  # In-progress downloads/scratch
+HEAD_BYTES = 4096  # Prefix hashed to split same-size candidates
+BLOCK_SIZE = 1 << 20  # Read size for full-file hashing
+TEMP_ITEM_WORKERS = 4  # Per-target pool for deleting temp entries
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Pass 2 for spinning disks
+
+# Bound once with an explicit prototype; None off Windows
+try:
+    from ctypes import wintypes
+    _GetDiskFreeSpaceExW = ctypes.windll.kernel32.GetDiskFreeSpaceExW
+    _GetDiskFreeSpaceExW.argtypes = [
+        wintypes.LPCWSTR,
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+    ]
+    _GetDiskFreeSpaceExW.restype = wintypes.BOOL
+except (AttributeError, ValueError):
+    _GetDiskFreeSpaceExW = None
+
+# One read buffer per hashing thread
+_thread_local = threading.local()
+
+
+def _is_link(st) -> bool:
+    """Symlinks, and on Windows junctions/reparse points; never recurse into these."""
+    return (stat.S_ISLNK(st.st_mode)
+            or bool(getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT))
+
+
+def _remove_link(path):
+    """Remove a symlink or junction itself, leaving its target alone."""
+    try:
+        os.rmdir(path)  # Directory links / junctions on Windows
+    except OSError:
+        os.unlink(path)
+
+
+def _clean_item(item: Path) -> int:
+    """Delete one top-level temp entry, returning the bytes freed."""
+    try:
+        st = os.lstat(item)
+        if _is_link(st):
+            _remove_link(item)
+        elif stat.S_ISDIR(st.st_mode):
+            return remove_tree(item)
+        else:
+            os.unlink(item)
+            return st.st_size
+    except:
+        pass
+    return 0
+
+
+def _clean_target(target: str) -> int:
+    """Clean one temp directory, deleting its entries on a small pool."""
+    if not os.path.exists(target):
+        return 0
+    try:
+        items = list(Path(target).iterdir())
+    except:
+        return 0
+    with ThreadPoolExecutor(max_workers=TEMP_ITEM_WORKERS) as pool:
+        return sum(pool.map(_clean_item, items))
 
 
 def clean_temp_folders():
     """Clean standard temp directories."""
-    total_freed = 0
-    for target in C_DRIVE_TARGETS:
-        if os.path.exists(target):
+    # Targets are independent trees; clean them concurrently
+    with ThreadPoolExecutor(max_workers=len(C_DRIVE_TARGETS)) as pool:
+        total_freed = sum(pool.map(_clean_target, C_DRIVE_TARGETS))
+    return total_freed / (1024**3)  # Return GB
+
+
+def iter_files(root: str, skip_hidden: bool = False, skip_dirs=frozenset(),
+               max_depth: int = None):
+    """Yield a DirEntry for every file under root, using scandir's cached types.
+
+    Each directory is listed in full before its entries are yielded, so no
+    directory handle is held open while the caller moves or deletes files.
+    """
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
             try:
-                for item in Path(target).iterdir():
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune hidden/system and known noise folders
+                    if not descend or entry.name in skip_dirs:
+                        continue
+                    if not (skip_hidden and entry.name.startswith('.')):
+                        stack.append((entry.path, depth + 1))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+            except OSError:
+                pass
+
+
+def remove_tree(path) -> int:
+    """Delete a directory tree in a single pass, returning the bytes freed."""
+    freed = 0
+    if hasattr(os, 'fwalk'):
+        # POSIX: stat/unlink relative to each directory fd instead of full paths
+        for _, dirs, files, dfd in os.fwalk(path, topdown=False):
+            for name in files:
+                try:
+                    size = os.stat(name, dir_fd=dfd, follow_symlinks=False).st_size
+                    os.unlink(name, dir_fd=dfd)
+                    freed += size
+                except OSError:
+                    pass
+            for name in dirs:
+                try:
+                    os.rmdir(name, dir_fd=dfd)
+                except NotADirectoryError:
                     try:
-                        if item.is_file():
-                            size = item.stat().st_size
-                            item.unlink()
-                            total_freed += size
-                        elif item.is_dir():
-                            size = sum(f.stat().st_size for f in item.rglob('*') if f.is_file())
-                            shutil.rmtree(item, ignore_errors=True)
-                            total_freed += size
-                    except:
+                        os.unlink(name, dir_fd=dfd)  # Symlink to a directory
+                    except OSError:
                         pass
-            except:
+                except OSError:
+                    pass
+    else:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+                if _is_link(st):
+                    # Junctions report is_dir() even without following; drop the link only
+                    _remove_link(entry.path)
+                elif stat.S_ISDIR(st.st_mode):
+                    freed += remove_tree(entry.path)
+                else:
+                    os.unlink(entry.path)
+                    freed += st.st_size
+            except OSError:
                 pass
-    return total_freed / (1024**3)  # Return GB
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+    return freed
 
 
-def find_duplicates(search_path: str, min_size_mb: float = DEDUP_MIN_SIZE_MB):
+def head_hash(fpath, fsize: int) -> int:
+    """Cheap fingerprint of a file's first HEAD_BYTES, mixed with its size."""
+    with open(fpath, 'rb') as f:
+        data = f.read(HEAD_BYTES)
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64(data).intdigest() ^ fsize
+    return int.from_bytes(hashlib.md5(data).digest(), "big") ^ fsize
+
+
+def _block_buffer() -> bytearray:
+    buf = getattr(_thread_local, "buf", None)
+    if buf is None:
+        buf = _thread_local.buf = bytearray(BLOCK_SIZE)
+    return buf
+
+
+def full_hash(fpath) -> str:
+    """Hash a whole file, streaming it through this thread's reused buffer."""
+    buf = _block_buffer()
+    hasher = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.md5()
+    view = memoryview(buf)
+    with open(fpath, 'rb') as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def _head_entry(item):
+    fpath, fsize = item
+    try:
+        return head_hash(fpath, fsize), fpath
+    except:
+        return None, fpath
+
+
+def _full_entry(fpath):
+    try:
+        return full_hash(fpath), fpath
+    except:
+        return None, fpath
+
+
+def find_duplicates(search_path: str, min_size_mb: float = DEDUP_MIN_SIZE_MB,
+                    max_workers: int = HASH_WORKERS, max_depth: int = None):
     """Find duplicate files by hash."""
+    size_map = defaultdict(list)
     hash_map = defaultdict(list)
     min_size = min_size_mb * 1024 * 1024
     
-    for root, dirs, files in os.walk(search_path):
-        # Skip hidden/system folders
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
+    for entry in iter_files(search_path, skip_hidden=True,
+                            skip_dirs=DEDUP_SKIP_DIRS, max_depth=max_depth):
+        if os.path.splitext(entry.name)[1].lower() in DEDUP_SKIP_EXTS:
+            continue
+        try:
+            fsize = entry.stat(follow_symlinks=False).st_size
+            if fsize >= min_size:
+                size_map[fsize].append(entry.path)
+        except:
+            pass
+    
+    # Only files sharing a size with another file can be duplicates
+    candidates = [(fpath, fsize) for fsize, paths in size_map.items()
+                  if len(paths) > 1 for fpath in paths]
+    
+    # Hash on a thread pool; file reads and hashing both release the GIL
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Split the buckets on a cheap head hash first
+        head_groups = defaultdict(list)
+        for head, fpath in pool.map(_head_entry, candidates):
+            if head is not None:
+                head_groups[head].append(fpath)
         
-        for fname in files:
-            fpath = Path(root) / fname
-            try:
-                if fpath.stat().st_size >= min_size:
-                    # Quick hash (first 64KB + file size)
-                    with open(fpath, 'rb') as f:
-                        data = f.read(65536)
-                    file_hash = hashlib.md5(data + str(fpath.stat().st_size).encode()).hexdigest()
-                    hash_map[file_hash].append(str(fpath))
-            except:
-                pass
+        # Confirm remaining collisions with a full-content hash
+        to_confirm = [fpath for group in head_groups.values()
+                      if len(group) > 1 for fpath in group]
+        for digest, fpath in pool.map(_full_entry, to_confirm):
+            if digest is not None:
+                hash_map[digest].append(fpath)
     
     # Return only duplicates
     return {h: paths for h, paths in hash_map.items() if len(paths) > 1}
 
 
+def _move(src: str, dst: str):
+    """Rename in place (one syscall on the same volume); copy+delete across volumes."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
 def archive_by_date(source_path: str, archive_name: str = "general"):
     """Move old files to dated archive structure on D: drive."""
     archive_base = ARCHIVE_ROOT / archive_name
     archive_base.mkdir(parents=True, exist_ok=True)
     
     moved = 0
-    for root, dirs, files in os.walk(source_path):
-        for fname in files:
-            fpath = Path(root) / fname
-            try:
-                mtime = datetime.fromtimestamp(fpath.stat().st_mtime)
-                year_month = mtime.strftime("%Y-%m")
+    month_dirs = {}  # year_month -> created dest dir
+    for entry in iter_files(source_path):
+        try:
+            mtime = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+            year_month = mtime.strftime("%Y-%m")
+            dest_dir = month_dirs.get(year_month)
+            if dest_dir is None:
                 dest_dir = archive_base / year_month
                 dest_dir.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(fpath), str(dest_dir / fname))
-                moved += 1
-            except:
-                pass
+                month_dirs[year_month] = dest_dir
+            _move(entry.path, str(dest_dir / entry.name))
+            moved += 1
+        except:
+            pass
     return moved
 
 
 def get_drive_stats():
     """Get C: and D: drive free space."""
-    import ctypes
     stats = {}
+    free_bytes = ctypes.c_ulonglong(0)
     for drive in ['C:', 'D:']:
         try:
-            free_bytes = ctypes.c_ulonglong(0)
-            ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                ctypes.c_wchar_p(drive), None, None, ctypes.pointer(free_bytes)
-            )
+            if not _GetDiskFreeSpaceExW(drive, None, None, ctypes.byref(free_bytes)):
+                raise ctypes.WinError()
             stats[drive] = round(free_bytes.value / (1024**3), 2)
         except:
             stats[drive] = 0
@@ -0,0 +1,41 @@
+"""
+hndl-it Path Setup
+Writes hndl_it.pth into the active interpreter's site-packages so the project
+root and mcp-servers/ are importable from any entry point. The interpreter
+applies it once at startup, so scripts no longer patch sys.path themselves.
+
+Run once per venv:  python scripts/install_pth.py
+"""
+import os
+import site
+import sys
+import sysconfig
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PTH_NAME = "hndl_it.pth"
+
+PATHS = [
+    PROJECT_ROOT,
+    os.path.join(PROJECT_ROOT, "mcp-servers"),
+]
+
+
+def install_pth() -> str:
+    """Write the .pth file and return its path."""
+    site_dir = sysconfig.get_paths()["purelib"]
+    if not os.access(site_dir, os.W_OK):
+        # System interpreter without admin rights: fall back to user site
+        site_dir = site.getusersitepackages()
+        os.makedirs(site_dir, exist_ok=True)
+
+    pth_path = os.path.join(site_dir, PTH_NAME)
+    with open(pth_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(PATHS) + "\n")
+    return pth_path
+
+
+if __name__ == "__main__":
+    path = install_pth()
+    print(f"✅ Wrote {path} for {sys.executable}")
+    for p in PATHS:
+        print(f"   {p}")
@@ -1,29 +1,35 @@
 
+import os
 import sys
-from unittest.mock import MagicMock
 import time
+import types
 import asyncio
 
+# Simulated per-call latency in seconds; zero unless MOCK_OLLAMA_LATENCY is set
+LATENCY = float(os.environ.get("MOCK_OLLAMA_LATENCY") or 0)
+
+MOCK_RESPONSE = {"response": '{"target": "browser", "action": "navigate", "params": {"url": "http://example.com"}}'}
+
 # Mock ollama module
-mock_ollama = MagicMock()
+mock_ollama = types.ModuleType("ollama")
 
 class MockClient:
     def __init__(self, host=None, timeout=None):
         pass
 
     def generate(self, model, prompt, stream=False, options=None):
-        # Simulate network latency
-        time.sleep(0.1)
-        return {"response": '{"target": "browser", "action": "navigate", "params": {"url": "http://example.com"}}'}
+        if LATENCY:
+            time.sleep(LATENCY)  # Simulate network latency
+        return dict(MOCK_RESPONSE)
 
 class MockAsyncClient:
     def __init__(self, host=None, timeout=None):
         pass
 
     async def generate(self, model, prompt, stream=False, options=None):
-        # Simulate network latency
-        await asyncio.sleep(0.1)
-        return {"response": '{"target": "browser", "action": "navigate", "params": {"url": "http://example.com"}}'}
+        if LATENCY:
+            await asyncio.sleep(LATENCY)  # Simulate network latency
+        return dict(MOCK_RESPONSE)
 
 mock_ollama.Client = MockClient
 mock_ollama.AsyncClient = MockAsyncClient
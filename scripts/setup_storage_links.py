@@ -3,9 +3,16 @@ hndl-it Storage Protocol Setup
 Implements the redirection of C: folders to D: workshop via Directory Junctions.
 """
 import os
+import stat
 import subprocess
 import shutil
-from pathlib import Path
+
+# Reparse tags that make a directory a link (lstat's st_reparse_tag, Windows only)
+_LINK_REPARSE_TAGS = (
+    getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003),
+    getattr(stat, "IO_REPARSE_TAG_SYMLINK", 0xA000000C),
+)
+
 
 def create_junction(source: str, target: str):
     """
@@ -18,19 +25,34 @@ def create_junction(source: str, target: str):
     # Ensure target exists
     os.makedirs(target, exist_ok=True)
     
+    # One lstat answers exists / is-link / is-dir for the source
+    try:
+        st = os.lstat(source)
+    except FileNotFoundError:
+        st = None
+    
     # If source exists and is not a link, move contents to target
-    if os.path.exists(source):
-        if os.path.islink(source) or (os.path.isdir(source) and hasattr(os, 'readlink') and os.path.islink(source)):
+    if st is not None:
+        # Junctions are mount-point reparse points rather than S_IFLNK entries.
+        # Other reparse tags (OneDrive placeholders, dedup, ...) are real
+        # folders and still get moved.
+        tag = getattr(st, "st_reparse_tag", 0)
+        if stat.S_ISLNK(st.st_mode) or tag in _LINK_REPARSE_TAGS:
             print(f"  Skipping: {source} is already a link.")
             return
         
         print(f"  Moving existing files from {source} to {target}...")
         try:
+            # Names already in target, listed once (normcase: case-insensitive on Windows)
+            with os.scandir(target) as it:
+                existing = {os.path.normcase(entry.name) for entry in it}
+            
             # Move all items in source to target
-            for item in Path(source).iterdir():
-                dest = Path(target) / item.name
-                if not dest.exists():
-                    shutil.move(str(item), str(dest))
+            with os.scandir(source) as it:
+                items = list(it)
+            for item in items:
+                if os.path.normcase(item.name) not in existing:
+                    shutil.move(item.path, os.path.join(target, item.name))
             
             # Remove empty source directory
             os.rmdir(source)
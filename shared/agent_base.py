@@ -27,6 +27,22 @@ try:
 except ImportError:
     WATCHDOG_AVAILABLE = False
 
+# With watchdog running, the loop only wakes on events; this re-check just
+# covers events the observer drops (e.g. buffer overflow)
+WATCHDOG_RECHECK_INTERVAL = 30.0
+
+_logging_configured = False
+
+def _setup_logging():
+    """Configure root logging once per process, however many agents start."""
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        _logging_configured = True
+
 class BaseAgent(ABC):
     """
     Abstract Base Class for robust agents.
@@ -46,11 +62,8 @@ class BaseAgent(ABC):
         self.ipc_event = threading.Event()
         self.observer = None
 
-        # Setup Logger
-        logging.basicConfig(
-            level=logging.INFO,
-            format=f"%(asctime)s - {agent_name} - %(levelname)s - %(message)s"
-        )
+        # Setup Logger (the logger name carries the agent prefix)
+        _setup_logging()
         self.logger = logging.getLogger(f"hndl-it.{agent_name}")
 
         # Thread Pool for parallel tasks
@@ -119,10 +132,10 @@ class BaseAgent(ABC):
     def _safe_process(self, action: str, payload: Dict[str, Any]):
         """Wrapper to catch exceptions in worker threads."""
         try:
-            self.logger.info(f"🔧 Processing: {action}")
+            self.logger.info("🔧 Processing: %s", action)
             self.process_action(action, payload)
         except Exception as e:
-            self.logger.error(f"❌ Error processing {action}: {e}", exc_info=True)
+            self.logger.error("❌ Error processing %s: %s", action, e, exc_info=True)
             # Optional: Send error back to UI
             send_command("floater", "display", {
                 "type": "error",
@@ -136,11 +149,13 @@ class BaseAgent(ABC):
         try:
             while self.running:
                 try:
-                    # Check for messages
-                    action, payload = check_mailbox(self.agent_name)
+                    # Drain every pending message before going back to sleep
+                    while self.running:
+                        action, payload = check_mailbox(self.agent_name)
+                        if not action:
+                            break
 
-                    if action:
-                        self.logger.info(f"📥 Received: {action}")
+                        self.logger.info("📥 Received: %s", action)
 
                         if action == "quit":
                             self.stop()
@@ -153,15 +168,16 @@ class BaseAgent(ABC):
                             # Submit to thread pool
                             self.executor.submit(self._safe_process, action, payload)
 
-                        # Loop immediately if we found work, to drain queue
-                        continue
-
                 except Exception as e:
-                    self.logger.error(f"⚠️ Loop Error: {e}")
+                    self.logger.error("⚠️ Loop Error: %s", e)
                     time.sleep(1) # Prevent tight loop on error
 
-                # Wait for event or timeout (poll interval)
-                self.ipc_event.wait(timeout=self.poll_interval)
+                if not self.running:
+                    break
+
+                # Block until watchdog signals the mailbox; poll only without it
+                timeout = WATCHDOG_RECHECK_INTERVAL if self.observer else self.poll_interval
+                self.ipc_event.wait(timeout=timeout)
                 self.ipc_event.clear()
 
         except KeyboardInterrupt:
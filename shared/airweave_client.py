@@ -10,13 +10,43 @@ import subprocess
 import json
 import logging
 import os
+import time
+import itertools
+import threading
 import asyncio
 import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
+# orjson parses/serializes several times faster; stdlib json is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_bytes(obj) -> bytes:
+        # Metadata may use int keys, which stdlib json stringifies; match that
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger("hndl-it.airweave")
 
+# Repeat queries within this window reuse the previous results
+SEARCH_CACHE_TTL = 30.0
+SEARCH_CACHE_SIZE = 256
+
+# Result text shown on a card before "View Full"
+CARD_PREVIEW_CHARS = 300
+
+# Max wait for one MCP search response
+MCP_TIMEOUT = 30.0
+
 @dataclass
 class AirweaveResult:
     """A single search result from Airweave."""
@@ -29,9 +59,13 @@ class AirweaveResult:
 
     def to_a2ui_card(self) -> Dict[str, Any]:
         """Convert to A2UI Card component format."""
+        card_id = f"airweave_{self.entity_id}"
+        content = self.content
+        if len(content) > CARD_PREVIEW_CHARS:
+            content = content[:CARD_PREVIEW_CHARS] + "..."
         return {
             "type": "Card",
-            "id": f"airweave_{self.entity_id}",
+            "id": card_id,
             "props": {
                 "title": self.title,
                 "subtitle": f"Score: {self.score:.2f} | Source: {self.source_name}",
@@ -40,14 +74,12 @@ class AirweaveResult:
             "children": [
                 {
                     "type": "Text",
-                    "id": f"airweave_{self.entity_id}_content",
-                    "props": {
-                        "text": self.content[:300] + "..." if len(self.content) > 300 else self.content
-                    }
+                    "id": card_id + "_content",
+                    "props": {"text": content}
                 },
                 {
                     "type": "Button",
-                    "id": f"airweave_{self.entity_id}_expand",
+                    "id": card_id + "_expand",
                     "props": {
                         "label": "View Full",
                         "action": "expand_result",
@@ -85,6 +117,26 @@ class AirweaveClient:
             "..", "..", "AG_HANDS", "airweave", "mcp"
         )
         
+        # Pooled keep-alive connections for the sync HTTP calls
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        if self.api_key:
+            self._session.headers.update({"x-api-key": self.api_key})
+        
+        # Async HTTP client for search, created on first use in a running loop
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop = None
+        
+        # Long-lived MCP server (mcp mode), started on first search
+        self._mcp_proc: Optional[subprocess.Popen] = None
+        self._mcp_lock = threading.Lock()
+        self._mcp_ids = itertools.count(1)
+        
+        # (query, limit, recency_bias, score_threshold) -> (timestamp, results)
+        self._cache = OrderedDict()
+        self._cache_ttl = SEARCH_CACHE_TTL
+        
         logger.info(f"AirweaveClient initialized: mode={mode}, collection={collection}")
 
     async def search(
@@ -106,16 +158,29 @@ class AirweaveClient:
         Returns:
             List of AirweaveResult objects
         """
+        key = (query, limit, round(recency_bias, 3), round(score_threshold, 3))
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached and now - cached[0] < self._cache_ttl:
+            self._cache.move_to_end(key)
+            return list(cached[1])
+        
         try:
             if self.mode == "http":
-                return await self._search_http(query, limit, recency_bias, score_threshold)
+                results = await self._search_http(query, limit, recency_bias, score_threshold)
             else:
-                return await self._search_mcp(query, limit, recency_bias, score_threshold)
+                results = await self._search_mcp(query, limit, recency_bias, score_threshold)
         except Exception as e:
+            # Failures are not cached, so the next call retries
             logger.error(f"Airweave search failed: {e}")
             return []
+        
+        self._cache[key] = (now, results)
+        self._cache.move_to_end(key)
+        while len(self._cache) > SEARCH_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return results
 
-    async def _search_http(
     def get_entity(self, entity_id: str) -> Optional[AirweaveResult]:
         """Fetch a single entity by ID."""
         try:
@@ -129,10 +194,6 @@ class AirweaveClient:
 
     def _get_entity_http(self, entity_id: str) -> Optional[AirweaveResult]:
         """Fetch entity via HTTP API."""
-        import requests
-
-        headers = {"x-api-key": self.api_key} if self.api_key else {}
-
         # Try direct point retrieval (common Vector DB pattern)
         # We try a few common patterns since API isn't strictly documented here
         endpoints = [
@@ -144,9 +205,9 @@ class AirweaveClient:
         for endpoint in endpoints:
             try:
                 url = f"{self.base_url}{endpoint}"
-                response = requests.get(url, headers=headers, timeout=5)
+                response = self._session.get(url, timeout=5)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     # Ensure we have a valid item structure
                     # Qdrant style: {"result": {"id": ..., "payload": ...}}
                     item = data.get("result", data)
@@ -155,9 +216,15 @@ class AirweaveClient:
             except Exception:
                 continue
 
-        # Fallback: Search for the ID
+        # Fallback: Search for the ID (sync session; get_entity runs off the event loop)
         logger.debug(f"Direct fetch failed for {entity_id}, falling back to search")
-        results = self._search_http(entity_id, limit=1, recency_bias=0, score_threshold=0.0)
+        response = self._session.get(
+            self._search_url(),
+            params=self._search_params(entity_id, limit=1, recency_bias=0, score_threshold=0.0),
+            timeout=10
+        )
+        response.raise_for_status()
+        results = self._parse_results(_json_loads(response.content).get("results", []))
 
         # Strict matching check
         for res in results:
@@ -169,11 +236,14 @@ class AirweaveClient:
     def _get_entity_mcp(self, entity_id: str) -> Optional[AirweaveResult]:
         """Fetch entity via MCP."""
         # MCP doesn't support direct get in this version, fallback to search
-        results = self._search_mcp(entity_id, limit=1, recency_bias=0, score_threshold=0.0)
+        results = asyncio.run(
+            self._search_mcp(entity_id, limit=1, recency_bias=0, score_threshold=0.0)
+        )
         for res in results:
             if str(res.entity_id) == str(entity_id):
                 return res
         return None
+
     def store(
         self,
         content: str,
@@ -189,6 +259,8 @@ class AirweaveClient:
         Returns:
             True if successful, False otherwise
         """
+        # New content can change any cached search
+        self._cache.clear()
         try:
             if self.mode == "http":
                 return self._store_http(content, metadata)
@@ -198,44 +270,64 @@ class AirweaveClient:
             logger.error(f"Airweave store failed: {e}")
             return False
 
-    def _search_http(
-        self,
+    def _search_url(self) -> str:
+        return f"{self.base_url}/collections/{self.collection}/search"
+
+    @staticmethod
+    def _search_params(
         query: str,
         limit: int,
         recency_bias: float,
         score_threshold: float
-    ) -> List[AirweaveResult]:
-        """Search via HTTP API."""
-        
-        url = f"{self.base_url}/collections/{self.collection}/search"
-        headers = {"x-api-key": self.api_key} if self.api_key else {}
-        
-        params = {
+    ) -> Dict[str, Any]:
+        return {
             "query": query,
             "limit": limit,
             "recency_bias": recency_bias,
             "score_threshold": score_threshold,
             "response_type": "raw"
         }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+
+    async def _search_http(
+        self,
+        query: str,
+        limit: int,
+        recency_bias: float,
+        score_threshold: float
+    ) -> List[AirweaveResult]:
+        """Search via HTTP API."""
+        params = self._search_params(query, limit, recency_bias, score_threshold)
+        response = await self._async_client().get(self._search_url(), params=params)
+        response.raise_for_status()
+        data = _json_loads(response.content)
 
         return self._parse_results(data.get("results", []))
 
-    async def _search_mcp(
+    def _async_client(self) -> httpx.AsyncClient:
+        """Shared AsyncClient so concurrent searches reuse pooled connections."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            # Pools are bound to the loop they were first used on
+            self._aclient = httpx.AsyncClient(
+                timeout=10.0,
+                headers={"x-api-key": self.api_key} if self.api_key else {}
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def aclose(self):
+        """Close the shared AsyncClient."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
     def _store_http(
         self,
         content: str,
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Store via HTTP API."""
-        import requests
-
         url = f"{self.base_url}/collections/{self.collection}/documents"
-        headers = {"x-api-key": self.api_key} if self.api_key else {}
 
         payload = {
             "documents": [
@@ -246,22 +338,26 @@ class AirweaveClient:
             ]
         }
 
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = self._session.post(
+            url,
+            data=_json_bytes(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=10
+        )
         response.raise_for_status()
         return True
 
-    def _search_mcp(
+    async def _search_mcp(
         self,
         query: str,
         limit: int,
         recency_bias: float,
         score_threshold: float
     ) -> List[AirweaveResult]:
-        """Search via MCP subprocess call."""
+        """Search via MCP subprocess call. Raises on MCP errors and timeouts."""
         # Build MCP tool call request
         mcp_request = {
             "jsonrpc": "2.0",
-            "id": 1,
             "method": "tools/call",
             "params": {
                 "name": f"search-{self.collection}",
@@ -274,43 +370,100 @@ class AirweaveClient:
             }
         }
         
-        # Set up environment for MCP server
-        env = os.environ.copy()
-        env["AIRWEAVE_API_KEY"] = self.api_key
-        env["AIRWEAVE_COLLECTION"] = self.collection
-        env["AIRWEAVE_BASE_URL"] = self.base_url
-        
-        def run_subprocess():
-            return subprocess.run(
-                ["npx", "airweave-mcp-search"],
-                input=json.dumps(mcp_request),
-                capture_output=True,
-                text=True,
-                env=env,
-                cwd=self.mcp_path,
-                timeout=30
+        # Reuse one MCP server process instead of paying Node startup per query
+        try:
+            response = await asyncio.wait_for(
+                asyncio.to_thread(self._mcp_call, mcp_request),
+                timeout=MCP_TIMEOUT
             )
-
-        # Call MCP server
-        result = await asyncio.to_thread(run_subprocess)
-        
-        if result.returncode != 0:
-            logger.error(f"MCP search failed: {result.stderr}")
-            return []
+        except asyncio.TimeoutError:
+            self._stop_mcp()  # Unblocks the reader; the next call restarts the server
+            raise TimeoutError(f"MCP search timed out after {MCP_TIMEOUT:.0f}s")
         
         # Parse MCP response
-        response = json.loads(result.stdout)
         if "error" in response:
-            logger.error(f"MCP error: {response['error']}")
-            return []
+            raise RuntimeError(f"MCP error: {response['error']}")
         
         content = response.get("result", {}).get("content", [])
         if content and content[0].get("type") == "text":
-            data = json.loads(content[0]["text"])
+            data = _json_loads(content[0]["text"])
             return self._parse_results(data.get("results", []))
         
         return []
 
+    def _ensure_mcp(self) -> subprocess.Popen:
+        """Start the long-lived MCP server if it isn't running. Call with _mcp_lock held."""
+        if self._mcp_proc is not None and self._mcp_proc.poll() is None:
+            return self._mcp_proc
+        
+        # Set up environment for MCP server
+        env = os.environ.copy()
+        env["AIRWEAVE_API_KEY"] = self.api_key
+        env["AIRWEAVE_COLLECTION"] = self.collection
+        env["AIRWEAVE_BASE_URL"] = self.base_url
+        
+        self._mcp_proc = subprocess.Popen(
+            ["npx", "airweave-mcp-search"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            env=env,
+            cwd=self.mcp_path
+        )
+        self._mcp_roundtrip(self._mcp_proc, {
+            "jsonrpc": "2.0",
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "hndl-it", "version": "1.0"}
+            }
+        })
+        self._mcp_send(self._mcp_proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return self._mcp_proc
+
+    def _mcp_send(self, proc: subprocess.Popen, message: Dict[str, Any]):
+        proc.stdin.write(_json_bytes(message).decode() + "\n")
+        proc.stdin.flush()
+
+    def _mcp_roundtrip(self, proc: subprocess.Popen, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one JSON-RPC request and read lines until its response arrives."""
+        request_id = next(self._mcp_ids)
+        self._mcp_send(proc, {**request, "id": request_id})
+        while True:
+            line = proc.stdout.readline()
+            if not line:
+                raise RuntimeError(f"MCP server exited (code {proc.poll()})")
+            message = _json_loads(line)
+            if message.get("id") == request_id:
+                return message
+
+    def _mcp_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Blocking request over the shared MCP stdio pipe."""
+        with self._mcp_lock:
+            try:
+                return self._mcp_roundtrip(self._ensure_mcp(), request)
+            except Exception:
+                self._stop_mcp()
+                raise
+
+    def _stop_mcp(self):
+        proc, self._mcp_proc = getattr(self, "_mcp_proc", None), None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+
+    def close(self):
+        """Shut down the MCP server process and close pooled HTTP connections."""
+        self._stop_mcp()
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+    def __del__(self):
+        self.close()
+
     def _parse_single_result(self, item: Dict) -> AirweaveResult:
         """Parse a single raw result item into AirweaveResult."""
         payload = item.get("payload", {})
@@ -3,21 +3,73 @@ Evaluation Logger for hndl-it
 Logs agent performance, errors, and LLM outputs for future optimization/evaluation.
 """
 import os
+import copy
 import json
 import time
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+# orjson serializes several times faster; stdlib json is the fallback
+try:
+    import orjson
+
+    def dumps_bytes(obj) -> bytes:
+        # meta may use int keys, which stdlib json stringifies; match that
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # Config - Use D: drive for logs as per Storage Standard, fallback to C:
 PRIMARY_LOG_DIR = Path(r"D:\hndl-it\logs\evals")
 FALLBACK_LOG_DIR = Path(os.environ.get("APPDATA", "C:")) / "hndl-it" / "logs" / "evals"
 
+# The writer thread drains the queue every FLUSH_INTERVAL, or sooner once
+# FLUSH_ENTRIES are waiting; past MAX_PENDING the oldest entries are dropped
+FLUSH_ENTRIES = 256
+FLUSH_INTERVAL = 0.5  # seconds
+MAX_PENDING = 10000
+
+def _snapshot_meta(meta) -> dict:
+    """Deep copy of meta taken on the caller's thread; never raises.
+
+    Entries are serialized later on the writer thread, so the copy keeps
+    caller mutation out of the queued entry. Uncopyable meta (locks, handles)
+    is kept as its repr instead.
+    """
+    if not meta:
+        return {}
+    try:
+        return copy.deepcopy(meta)
+    except Exception as e:
+        print(f"Failed to copy log meta: {e}")
+        try:
+            return {"repr": repr(meta)}
+        except Exception:
+            return {}
+
 class EvalLogger:
     def __init__(self, agent_name: str = "general"):
         self.agent_name = agent_name
         self.log_dir = self._get_valid_log_dir()
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = self.log_dir / f"{self.agent_name}.jsonl"
+        
+        # Producers only enqueue raw entries; a background thread does the I/O
+        self._fh = None
+        self._pending = deque(maxlen=MAX_PENDING)
+        self._dropped = 0
+        self._lock = threading.RLock()  # Serializes drains (writer thread vs flush/close)
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name=f"eval-log-{agent_name}", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
     def _get_valid_log_dir(self) -> Path:
         """Check if D: is available, else fallback."""
@@ -31,35 +83,98 @@ class EvalLogger:
     def log(self, agent: str, task: str, output: str, error: str = None, meta: dict = None):
         """Standard log implementation."""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),  # Formatted at flush time
             "agent": agent,
             "task": task,
             "output": output,
             "error": error,
             "success": error is None,
-            "meta": meta or {}
+            "meta": _snapshot_meta(meta)
         }
         self._write_entry(entry)
 
     def log_task(self, input_text: str, output_text: str, meta: dict = None, error: str = None):
         """Simplified task-centric logging for agents."""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),  # Formatted at flush time
             "agent": self.agent_name,
             "input": input_text,
             "output": output_text,
             "error": error,
             "success": error is None,
-            "meta": meta or {}
+            "meta": _snapshot_meta(meta)
         }
         self._write_entry(entry)
 
     def _write_entry(self, entry: dict):
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception as e:
-            print(f"Failed to write log: {e}")
+        # Only queue the raw entry; ISO timestamps, JSON and disk I/O happen on the writer.
+        # meta is snapshotted by the callers, so later caller mutation can't change it.
+        if len(self._pending) == MAX_PENDING:
+            self._dropped += 1  # append() below evicts the oldest entry
+        self._pending.append(entry)
+        if self._closed:
+            # Writer thread is gone: write synchronously so late entries still land.
+            # Checked after the append, so an entry racing close() is never stranded.
+            self._drain_and_release()
+        elif len(self._pending) >= FLUSH_ENTRIES:
+            self._wake.set()
+
+    def get_dropped(self) -> int:
+        """Number of entries discarded because the queue was full."""
+        return self._dropped
+
+    def _writer_loop(self):
+        while not self._closed:
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            self._drain()
+
+    @staticmethod
+    def _encode(entry: dict) -> bytes:
+        entry["timestamp"] = datetime.fromtimestamp(entry["timestamp"]).isoformat()
+        return dumps_bytes(entry) + b"\n"
+
+    def _drain(self):
+        with self._lock:
+            while self._pending:
+                lines = []
+                while self._pending and len(lines) < FLUSH_ENTRIES:
+                    entry = self._pending.popleft()
+                    try:
+                        lines.append(self._encode(entry))
+                    except Exception as e:
+                        print(f"Failed to write log: {e}")
+                try:
+                    if self._fh is None:
+                        self._fh = open(self.log_file, "ab")
+                    self._fh.write(b"".join(lines))
+                    self._fh.flush()
+                except Exception as e:
+                    print(f"Failed to write log: {e}")
+
+    def flush(self):
+        """Write any queued entries to disk."""
+        self._drain()
+
+    def _drain_and_release(self):
+        with self._lock:
+            self._drain()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def close(self):
+        """Stop the writer thread, flush, and release the log file handle.
+
+        Entries logged after close() are written synchronously.
+        """
+        # Drop the exit hook so closed loggers are not kept alive until exit
+        atexit.unregister(self.close)
+        self._closed = True
+        self._wake.set()
+        if self._writer.is_alive() and self._writer is not threading.current_thread():
+            self._writer.join(timeout=2.0)
+        self._drain_and_release()
 
 # Singleton support for backward compatibility
 _instance = None
@@ -9,11 +9,12 @@ Messages are atomic-write and consumed on read.
 import json
 import os
 import time
+import functools
 import logging
-import tempfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple, List
-from datetime import datetime
 
 # Define IPC Directory relative to this file
 IPC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ipc")
@@ -24,7 +25,26 @@ if not os.path.exists(IPC_DIR):
 
 logger = logging.getLogger("hndl-it.ipc")
 
+# orjson serializes several times faster; stdlib json is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
 
+    def _json_dumps(obj) -> bytes:
+        # Payloads may use int keys, which stdlib json stringifies; match that
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Mailboxes are transient, so no fsync; O_BINARY keeps Windows from translating bytes
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+@functools.lru_cache(maxsize=64)
 def get_mailbox_path(target: str) -> str:
     """Returns the absolute path for a target's mailbox."""
     return os.path.join(IPC_DIR, f"{target}.json")
@@ -42,22 +62,44 @@ def send_command(target: str, action: str, payload: Optional[Dict[str, Any]] = N
     Returns:
         True if sent successfully, False otherwise
     """
-    fpath = get_mailbox_path(target)
-    
-    data = {
+    try:
+        blob = _encode_message(action, payload)
+    except Exception as e:
+        logger.error(f"❌ IPC send failed ({target}): {e}")
+        return False
+    return _write_mailbox(target, action, blob)
+
+
+def _encode_message(action: str, payload: Optional[Dict[str, Any]]) -> bytes:
+    return _json_dumps({
         "action": action,
         "payload": payload or {},
-        "timestamp": time.time(),
-        "sent_at": datetime.now().isoformat()
-    }
+        "timestamp": time.time()  # Readers format this if they need wall-clock text
+    })
+
+
+@functools.lru_cache(maxsize=64)
+def _tmp_path(target: str, pid: int, thread_id: int) -> str:
+    return os.path.join(IPC_DIR, f".{target}.{pid}.{thread_id}.tmp")
+
+
+def _write_mailbox(target: str, action: str, blob: bytes) -> bool:
+    """Atomically replace target's mailbox with an encoded message."""
+    fpath = get_mailbox_path(target)
+    # Fixed per-process/per-thread scratch name instead of mkstemp's random one;
+    # concurrent writers never share it, and os.replace consumes it each send
+    tmp_path = _tmp_path(target, os.getpid(), threading.get_ident())
     
     try:
         # Atomic write: write to temp file then rename
         # We use a temp file in the SAME directory to ensure atomic rename works
-        fd, tmp_path = tempfile.mkstemp(dir=IPC_DIR, suffix=".tmp")
-
-        with os.fdopen(fd, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        fd = os.open(tmp_path, _TMP_FLAGS, 0o600)
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
         # Atomic replacement
         os.replace(tmp_path, fpath)
@@ -68,11 +110,7 @@ def send_command(target: str, action: str, payload: Optional[Dict[str, Any]] = N
     except Exception as e:
         logger.error(f"❌ IPC send failed ({target}): {e}")
         # Try to clean up temp file if it exists
-        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-            except:
-                pass
+        _safe_remove(tmp_path)
         return False
 
 
@@ -89,13 +127,15 @@ def check_mailbox(target: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]
     """
     fpath = get_mailbox_path(target)
     
-    if not os.path.exists(fpath):
-        return None, None
-    
     try:
-        # Read first
-        with open(fpath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Read first (open directly: one syscall, and no exists()/open race
+        # between consumers; a missing file is the common empty case)
+        try:
+            f = open(fpath, 'rb')
+        except FileNotFoundError:
+            return None, None
+        with f:
+            data = _json_loads(f.read())
         
         # Then delete (Consume)
         try:
@@ -126,17 +166,27 @@ def peek_mailbox(target: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
     """
     fpath = get_mailbox_path(target)
     
-    if not os.path.exists(fpath):
-        return None, None
-    
     try:
-        with open(fpath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(fpath, 'rb') as f:
+            data = _json_loads(f.read())
         return data.get("action"), data.get("payload", {})
     except:
         return None, None
 
 
+_broadcast_pool: Optional[ThreadPoolExecutor] = None
+_broadcast_pool_lock = threading.Lock()
+
+
+def _get_broadcast_pool() -> ThreadPoolExecutor:
+    """Create the broadcast writer pool on first use; most importers never broadcast."""
+    global _broadcast_pool
+    with _broadcast_pool_lock:
+        if _broadcast_pool is None:
+            _broadcast_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ipc-broadcast")
+        return _broadcast_pool
+
+
 def broadcast(action: str, payload: Optional[Dict[str, Any]] = None,
               targets: Optional[List[str]] = None) -> int:
     """
@@ -146,11 +196,17 @@ def broadcast(action: str, payload: Optional[Dict[str, Any]] = None,
         # Auto-discover targets based on running agents (could be enhanced)
         targets = ["floater", "todo", "read", "browser", "desktop", "voice", "brain"]
     
-    success_count = 0
-    for target in targets:
-        if send_command(target, action, payload):
-            success_count += 1
-    return success_count
+    try:
+        # Encode once; only the mailbox path differs per target
+        blob = _encode_message(action, payload)
+    except Exception as e:
+        logger.error(f"❌ IPC broadcast failed: {e}")
+        return 0
+    
+    # Write all mailboxes concurrently so the broadcast costs about one write
+    pool = _get_broadcast_pool()
+    futures = [pool.submit(_write_mailbox, target, action, blob) for target in targets]
+    return sum(f.result() for f in futures)
 
 
 def clear_all():
@@ -6,6 +6,7 @@ Strategy: Two-Gear Model (Resident Router + On-Demand Brain)
 """
 
 import os
+from types import MappingProxyType
 
 # ============================================================================
 # CONFIGURATION
@@ -17,7 +18,7 @@ OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 # ============================================================================
 # MODEL CATALOG
 # ============================================================================
-MODELS = {
+MODELS = MappingProxyType({
     # Vision
     "moondream": {"size_gb": 1.7, "type": "vision", "notes": "Image understanding"},
     "llava": {"size_gb": 4.0, "type": "vision", "notes": "Better vision, heavier"},
@@ -32,7 +33,9 @@ MODELS = {
     "qwen2.5:7b": {"size_gb": 4.7, "type": "brain", "notes": "Strong reasoning"},
     "llama3.1:8b": {"size_gb": 4.9, "type": "brain", "notes": "DeepThink pick"},
     "mistral": {"size_gb": 4.1, "type": "brain", "notes": "Balanced"},
-}
+})
+# Freeze each entry too; MappingProxyType alone only guards the top level
+MODELS = MappingProxyType({name: MappingProxyType(info) for name, info in MODELS.items()})
 
 # ============================================================================
 # ACTIVE CONFIGURATION
@@ -41,11 +44,16 @@ MODELS = {
 # - Router is always resident in VRAM (fast intent classification)
 # - Brain is loaded on-demand for complex tasks (then unloaded)
 
-ACTIVE_ROLES = {
+ACTIVE_ROLES = MappingProxyType({
     "router": os.getenv("MODEL_ROUTER", "gemma2:2b"),
     "brain": os.getenv("MODEL_BRAIN", "qwen2.5:3b"),
     "vision": os.getenv("MODEL_VISION", "moondream"),
-}
+})
+
+# Both tables are fixed at import, so the VRAM estimate is computed once.
+# Only the top-level mappings are read-only; the per-model dicts are plain
+# dicts and must not be edited at runtime, or this total goes stale.
+_ACTIVE_VRAM = sum(MODELS.get(model, {}).get("size_gb", 0) for model in ACTIVE_ROLES.values())
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -60,16 +68,15 @@ def get_model_for_role(role: str) -> str:
     return ACTIVE_ROLES.get(role, "qwen2.5:3b")
 
 def get_model_info(model_name: str) -> dict:
-    """Get model metadata."""
-    return MODELS.get(model_name, {"size_gb": 0, "type": "unknown", "notes": ""})
+    """Get model metadata (a copy; edits don't touch the catalog)."""
+    info = MODELS.get(model_name)
+    if info is None:
+        return {"size_gb": 0, "type": "unknown", "notes": ""}
+    return dict(info)
 
 def estimate_vram_usage() -> float:
     """Estimate total VRAM if all active models were loaded."""
-    total = 0
-    for role, model in ACTIVE_ROLES.items():
-        info = MODELS.get(model, {})
-        total += info.get("size_gb", 0)
-    return total
+    return _ACTIVE_VRAM
 
 def validate_config():
     """Validate current configuration fits in VRAM budget."""
@@ -8,9 +8,18 @@ import pyperclip
 import time
 import threading
 import logging
+import ctypes
 
 logger = logging.getLogger("hndl-it.tts-hotkeys")
 
+# How long to wait for the synthetic Ctrl+C to land on the clipboard
+COPY_TIMEOUT = 0.3
+
+try:
+    _GetClipboardSequenceNumber = ctypes.windll.user32.GetClipboardSequenceNumber
+except AttributeError:
+    _GetClipboardSequenceNumber = None  # Non-Windows: fall back to a fixed delay
+
 # Import local TTS (pyttsx3)
 try:
     from shared.voice_output import speak as local_speak
@@ -20,8 +29,31 @@ except ImportError:
     logger.warning("Local TTS (pyttsx3) not available, using Windows native only")
 
 
+def _wait_for_clipboard_update(seq: int) -> bool:
+    """Wait until the clipboard sequence number moves past `seq`."""
+    deadline = time.monotonic() + COPY_TIMEOUT
+    while time.monotonic() < deadline:
+        if _GetClipboardSequenceNumber() != seq:
+            return True
+        time.sleep(0.005)
+    return False
+
+
 def get_selected_text() -> str:
     """Copy selected text to clipboard and return it."""
+    if _GetClipboardSequenceNumber is not None:
+        # Windows bumps the sequence number on every clipboard write, so we
+        # return as soon as the copy lands instead of sleeping a fixed delay,
+        # and we don't need to read/compare the old clipboard contents.
+        seq = _GetClipboardSequenceNumber()
+        keyboard.send("ctrl+c")
+        if not _wait_for_clipboard_update(seq):
+            return ""  # Nothing new selected
+        try:
+            return pyperclip.paste().strip()
+        except:
+            return ""
+
     # Save current clipboard
     old_clipboard = ""
     try:
@@ -9,6 +9,26 @@ import logging
 
 logger = logging.getLogger("hndl-it.voice-output")
 
+# Preferred voices, in priority order
+PREFERRED_VOICES = ("Zira", "Hazel")
+
+# SAPI voice enumeration is slow; resolve the preferred voice once per process.
+_VOICE_UNSET = object()
+_preferred_voice_id = _VOICE_UNSET
+
+
+def preferred_voice_id(engine):
+    """Return the id of the first preferred voice (cached), or None."""
+    global _preferred_voice_id
+    if _preferred_voice_id is _VOICE_UNSET:
+        voices = engine.getProperty('voices')
+        _preferred_voice_id = next(
+            (v.id for v in voices if any(name in v.name for name in PREFERRED_VOICES)),
+            None
+        )
+    return _preferred_voice_id
+
+
 class VoiceOutput:
     def __init__(self):
         self.engine = pyttsx3.init()
@@ -16,11 +36,9 @@ class VoiceOutput:
         self.engine.setProperty('volume', 0.9)  # Volume
         
         # Set a clear, natural-sounding voice if available
-        voices = self.engine.getProperty('voices')
-        for voice in voices:
-            if "Zira" in voice.name or "Hazel" in voice.name:  # Preferred voices
-                self.engine.setProperty('voice', voice.id)
-                break
+        voice_id = preferred_voice_id(self.engine)
+        if voice_id:
+            self.engine.setProperty('voice', voice_id)
         
         self.queue = queue.Queue()
         self._stop_event = threading.Event()
@@ -31,11 +49,21 @@ class VoiceOutput:
         """Background worker to process speech requests without blocking UI."""
         while not self._stop_event.is_set():
             try:
-                text = self.queue.get(timeout=1)
-                if text:
+                batch = [self.queue.get(timeout=1)]
+                # Hand everything already queued to the engine and pump it once,
+                # rather than one runAndWait per message
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                texts = [text for text in batch if text]
+                for text in texts:
                     self.engine.say(text)
+                if texts:
                     self.engine.runAndWait()
-                self.queue.task_done()
+                for _ in batch:
+                    self.queue.task_done()
             except queue.Empty:
                 continue
             except Exception as e:
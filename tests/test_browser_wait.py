@@ -0,0 +1,53 @@
+import sys
+import os
+import unittest
+import json
+from unittest.mock import MagicMock, AsyncMock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class TestBrowserWait(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.modules_patcher = patch.dict('sys.modules', {
+            'httpx': MagicMock(),
+            'websockets': MagicMock()
+        })
+        self.modules_patcher.start()
+
+        if 'agents.browser.browser_controller' in sys.modules:
+            del sys.modules['agents.browser.browser_controller']
+
+        from agents.browser.browser_controller import BrowserController
+        self.controller = BrowserController()
+        self.controller._send_cdp = AsyncMock(return_value={"result": {"value": True}})
+
+    async def asyncTearDown(self):
+        self.modules_patcher.stop()
+        if 'agents.browser.browser_controller' in sys.modules:
+            del sys.modules['agents.browser.browser_controller']
+
+    async def test_wait_for_selector_awaits_promise(self):
+        selector = "div[contenteditable='true']"
+        self.assertTrue(await self.controller.wait_for_selector(selector, timeout=2))
+
+        method, params = self.controller._send_cdp.call_args[0]
+        self.assertEqual(method, "Runtime.evaluate")
+        self.assertTrue(params["awaitPromise"])
+        # Promise expression must not be wrapped in an IIFE (that would drop the value)
+        self.assertTrue(params["expression"].strip().startswith("new Promise"))
+        self.assertIn(json.dumps(selector), params["expression"])
+        self.assertIn("MutationObserver", params["expression"])
+        self.assertIn("2000", params["expression"])
+
+    async def test_wait_for_stable_uses_quiet_window(self):
+        self.controller._send_cdp.return_value = {"result": {"value": False}}
+        self.assertFalse(await self.controller.wait_for_stable(".markdown", quiet_ms=800, timeout=5))
+
+        _, params = self.controller._send_cdp.call_args[0]
+        self.assertTrue(params["expression"].strip().startswith("new Promise"))
+        self.assertIn("800", params["expression"])
+        self.assertIn("characterData: true", params["expression"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import tempfile
+import shutil
+import pytest
+from scripts import drive_cleanup
+
+
+def _make_tree(base):
+    """tree/ with 600 bytes in three files, plus keep/ outside it."""
+    root = os.path.join(base, "tree")
+    os.makedirs(os.path.join(root, "a", "b"))
+    for i, rel in enumerate(["f1", "a/f2", "a/b/f3"]):
+        with open(os.path.join(root, rel), "wb") as f:
+            f.write(b"x" * (100 * (i + 1)))
+
+    # Something outside the tree that a link inside it points at
+    outside = os.path.join(base, "keep")
+    os.makedirs(outside)
+    keep_file = os.path.join(outside, "keep.txt")
+    with open(keep_file, "wb") as f:
+        f.write(b"keep")
+    return root, outside, keep_file
+
+
+def _link(target, link):
+    try:
+        os.symlink(target, link, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not permitted here")
+
+
+class TestRemoveTree(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root, self.outside, self.keep_file = _make_tree(self.tmp)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_removes_tree_and_counts_bytes(self):
+        freed = drive_cleanup.remove_tree(self.root)
+        self.assertEqual(freed, 600)
+        self.assertFalse(os.path.exists(self.root))
+
+    def test_does_not_follow_directory_symlink(self):
+        _link(self.outside, os.path.join(self.root, "a", "link"))
+        drive_cleanup.remove_tree(self.root)
+        self.assertFalse(os.path.exists(self.root))
+        # The link is removed, never recursed through
+        self.assertTrue(os.path.exists(self.keep_file))
+
+
+def test_scandir_fallback_does_not_follow_symlink(tmp_path, monkeypatch):
+    root, outside, keep_file = _make_tree(str(tmp_path))
+    _link(outside, os.path.join(root, "a", "link"))
+    # Force the scandir (Windows) path; monkeypatch restores os.fwalk
+    monkeypatch.delattr(os, "fwalk", raising=False)
+
+    assert drive_cleanup.remove_tree(root) == 600
+    assert not os.path.exists(root)
+    assert os.path.exists(keep_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
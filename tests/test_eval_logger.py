@@ -0,0 +1,69 @@
+import unittest
+import json
+import threading
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+from shared.eval_logger import EvalLogger
+
+
+class TestEvalLogger(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        # Keep the D:/APPDATA log dirs out of it; the log file lands in tmp
+        with mock.patch.object(EvalLogger, "_get_valid_log_dir", return_value=self.tmp):
+            self.logger = EvalLogger(agent_name="test-agent")
+
+    def tearDown(self):
+        self.logger.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _read(self):
+        with open(self.logger.log_file, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_close_flushes_pending(self):
+        for i in range(5):
+            self.logger.log_task(f"in {i}", f"out {i}")
+        self.logger.close()
+
+        entries = self._read()
+        self.assertEqual([e["input"] for e in entries], [f"in {i}" for i in range(5)])
+        self.assertTrue(all(e["success"] for e in entries))
+        # Timestamps are formatted to ISO on the writer side
+        self.assertIn("T", entries[0]["timestamp"])
+
+    def test_log_after_close_is_written(self):
+        self.logger.close()
+        self.logger.log("agent", "task", "late", error="boom")
+
+        entries = self._read()
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["output"], "late")
+        self.assertFalse(entries[0]["success"])
+
+    def test_meta_is_snapshot(self):
+        meta = {"steps": [1]}
+        self.logger.log_task("in", "out", meta=meta)
+        meta["steps"].append(2)
+        self.logger.close()
+
+        self.assertEqual(self._read()[0]["meta"], {"steps": [1]})
+
+    def test_uncopyable_meta_does_not_raise(self):
+        self.logger.log("agent", "task", "out", meta={"lock": threading.Lock()})
+        self.logger.close()
+
+        self.assertIn("repr", self._read()[0]["meta"])
+
+    def test_non_string_meta_keys(self):
+        # Same result with orjson or stdlib json: keys come back as strings
+        self.logger.log_task("in", "out", meta={1: "a"})
+        self.logger.close()
+
+        self.assertEqual(self._read()[0]["meta"], {"1": "a"})
+
+
+if __name__ == '__main__':
+    unittest.main()
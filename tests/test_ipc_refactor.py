@@ -40,6 +40,34 @@ class TestIPC(unittest.TestCase):
         # Should get the latest
         self.assertEqual(action, "action2")
         self.assertEqual(data["id"], 2)
+    def test_non_string_keys(self):
+        # Same result with orjson or stdlib json: keys come back as strings
+        self.assertTrue(ipc.send_command(self.test_target, "keys", {1: "a"}))
+        self.assertEqual(ipc.check_mailbox(self.test_target), ("keys", {"1": "a"}))
+
+    def test_broadcast(self):
+        targets = [f"{self.test_target}_{i}" for i in range(3)]
+        sent = ipc.broadcast("ping", {"all": True}, targets=targets)
+        self.assertEqual(sent, len(targets))
+        for target in targets:
+            self.assertEqual(ipc.check_mailbox(target), ("ping", {"all": True}))
+
+    def test_no_scratch_files_left(self):
+        ipc.send_command(self.test_target, "a", {})
+        ipc.broadcast("b", targets=[self.test_target])
+        leftovers = [f for f in os.listdir(ipc.IPC_DIR) if f.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_empty_mailbox(self):
+        self.assertEqual(ipc.check_mailbox(self.test_target), (None, None))
+        self.assertEqual(ipc.peek_mailbox(self.test_target), (None, None))
+
+    def test_peek_does_not_consume(self):
+        ipc.send_command(self.test_target, "peeked", {"n": 1})
+        self.assertEqual(ipc.peek_mailbox(self.test_target), ("peeked", {"n": 1}))
+        self.assertEqual(ipc.check_mailbox(self.test_target), ("peeked", {"n": 1}))
+        self.assertEqual(ipc.check_mailbox(self.test_target), (None, None))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,8 +12,8 @@ import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
     QTreeWidget, QTreeWidgetItem, QFrame, QLabel, QMenu,
-    QTextEdit, QSplitter, QApplication, QDialog, QDialogButtonBox, QFormLayout
-    QTreeView, QFrame, QLabel, QMenu, QTextEdit, QTextBrowser, QApplication
+    QTextEdit, QSplitter, QApplication, QDialog, QDialogButtonBox, QFormLayout,
+    QTreeView, QTextBrowser
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QModelIndex
 from PyQt6.QtGui import QColor, QFont
@@ -34,6 +34,18 @@ COLORS = {
     'border': '#1a1a1a'
 }
 
+# Context menu stylesheet, formatted once rather than on every right-click
+MENU_STYLE = f"""
+    QMenu {{
+        background-color: {COLORS['bg_dark']};
+        color: {COLORS['text']};
+        border: 1px solid {COLORS['border']};
+    }}
+    QMenu::item:selected {{
+        background-color: {COLORS['primary']};
+    }}
+"""
+
 
 class QuickInputBox(QFrame):
     """One-click quick input for new todos."""
@@ -285,16 +297,7 @@ class TodoPanel(QFrame):
             return
             
         menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {COLORS['bg_dark']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['border']};
-            }}
-            QMenu::item:selected {{
-                background-color: {COLORS['primary']};
-            }}
-        """)
+        menu.setStyleSheet(MENU_STYLE)
         
         # Actions
         # Need to check state from model
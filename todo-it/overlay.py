@@ -5,9 +5,9 @@ Floating icon for todo-it module, similar to hndl-it overlay.
 
 import sys
 import os
-from PyQt6.QtWidgets import QWidget, QApplication, QVBoxLayout, QLabel
+from PyQt6.QtWidgets import QWidget, QApplication, QVBoxLayout, QLabel, QMenu
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QAction
 
 # Colors matching hndl-it theme
 COLORS = {
@@ -39,6 +39,10 @@ class TodoOverlay(QWidget):
         self._dragging = False
         self._drag_start = QPoint()
         
+        # Ring pen never changes; build it once rather than per paint
+        self._ring_pen = QPen(QColor(COLORS['primary']))
+        self._ring_pen.setWidth(2)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -66,9 +70,7 @@ class TodoOverlay(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Outer ring
-        pen = QPen(QColor(COLORS['primary']))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._ring_pen)
         painter.drawEllipse(2, 2, 56, 56)
     
     def mousePressEvent(self, event):
@@ -93,8 +95,6 @@ class TodoOverlay(QWidget):
             self.double_clicked.emit()
 
     def contextMenuEvent(self, event):
-        from PyQt6.QtWidgets import QMenu, QApplication
-        from PyQt6.QtGui import QAction
         menu = QMenu(self)
         
         close_action = QAction("Close", self)